@@ -41,6 +41,10 @@ DEFAULT_APP_SETTINGS = {
     "auto_sync_on_startup": False,
     "run_on_windows_startup": False,
     "theme": "system",
+    "canvas_fetch_engine": "rest",
+    "resolve_due_date_overrides": False,
+    "pipelined_sync": True,
+    "debug_artifacts": "summary",
 }
 
 
@@ -103,6 +107,9 @@ class AssignmentTrackerGUI(tk.Tk):
         self.sheet_patterns = None
         self.allowed_tabs = []
         self.storage_state = None
+        self.canvas_client = None
+        self.canvas_client_state = None
+        self.canvas_client_lock = threading.Lock()
         self.sheet_registry = {"selected_api_url": "", "sheets": []}
         self.sheet_name_to_url: dict[str, str] = {}
         self.selected_sheet_name_var = tk.StringVar(value="")
@@ -796,8 +803,14 @@ class AssignmentTrackerGUI(tk.Tk):
             configured_theme = "system"
 
         merged["theme"] = configured_theme
+        configured_engine = str(merged.get("canvas_fetch_engine") or "rest").lower()
+        merged["canvas_fetch_engine"] = configured_engine if configured_engine in ("rest", "graphql") else "rest"
         merged["auto_sync_on_startup"] = bool(merged.get("auto_sync_on_startup"))
         merged["run_on_windows_startup"] = bool(merged.get("run_on_windows_startup"))
+        merged["resolve_due_date_overrides"] = bool(merged.get("resolve_due_date_overrides"))
+        merged["pipelined_sync"] = bool(merged.get("pipelined_sync"))
+        configured_debug = str(merged.get("debug_artifacts") or "summary").lower()
+        merged["debug_artifacts"] = configured_debug if configured_debug in ("off", "summary", "full") else "summary"
         self.app_settings = merged
         self.settings_auto_sync_var.set(self.app_settings["auto_sync_on_startup"])
         self.settings_startup_app_var.set(self.app_settings["run_on_windows_startup"])
@@ -1132,14 +1145,24 @@ class AssignmentTrackerGUI(tk.Tk):
         ttk.Button(
             scroll_body,
             text="Sync all assignments",
-            command=lambda: self._start_sync(include_past=True, dry_run=False, replace_existing=False),
+            command=lambda: self._start_sync(
+                include_past=True,
+                dry_run=False,
+                replace_existing=False,
+                force_refresh=True,
+            ),
             width=button_width,
         ).pack(anchor="w", pady=4)
 
         ttk.Button(
             scroll_body,
             text="Sync future assignments",
-            command=lambda: self._start_sync(include_past=False, dry_run=False, replace_existing=False),
+            command=lambda: self._start_sync(
+                include_past=False,
+                dry_run=False,
+                replace_existing=False,
+                force_refresh=True,
+            ),
             width=button_width,
         ).pack(anchor="w", pady=4)
 
@@ -1487,30 +1510,26 @@ class AssignmentTrackerGUI(tk.Tk):
                 self._log("Starting sheet generation...")
                 self._log("This may take 30-60 seconds. Please wait...")
 
-                from playwright.sync_api import sync_playwright
+                storage_state = self.storage_state
+                api_context = self._canvas_api_client(storage_state)
+                auth_status = self._canvas_auth_status(api_context)
+                if auth_status != "authenticated":
+                    if auth_status == "unauthenticated":
+                        self._clear_canvas_session()
+                        raise RuntimeError(
+                            "Canvas session expired. Please sign in again before generating a sheet."
+                        )
+                    raise RuntimeError(
+                        "Could not verify Canvas session (network unavailable). Check your connection and retry."
+                    )
+
+                class RequestContextShim:
+                    def __init__(self, request, storage_state):
+                        self.request = request
+                        self.storage_state = storage_state
 
-                with sync_playwright() as p:
-                    api_context = p.request.new_context(storage_state=self.storage_state)
-                    try:
-                        auth_status = self._canvas_auth_status(api_context)
-                        if auth_status != "authenticated":
-                            if auth_status == "unauthenticated":
-                                self._clear_canvas_session()
-                                raise RuntimeError(
-                                    "Canvas session expired. Please sign in again before generating a sheet."
-                                )
-                            raise RuntimeError(
-                                "Could not verify Canvas session (network unavailable). Check your connection and retry."
-                            )
-
-                        class RequestContextShim:
-                            def __init__(self, request):
-                                self.request = request
-
-                        shim = RequestContextShim(api_context)
-                        new_sheet_url = self.backend.generate_formatted_sheet_from_template(shim)
-                    finally:
-                        api_context.dispose()
+                shim = RequestContextShim(api_context, storage_state)
+                new_sheet_url = self.backend.generate_formatted_sheet_from_template(shim)
 
                 generated_name = self.backend.infer_sheet_display_name(new_sheet_url)
                 self.after(
@@ -1604,6 +1623,30 @@ class AssignmentTrackerGUI(tk.Tk):
             pass
         self.playwright_manager = None
 
+    def _canvas_api_client(self, storage_state: dict):
+        """Return the shared Canvas client for storage_state, rebuilding it only when the session changes."""
+        with self.canvas_client_lock:
+            if self.canvas_client is not None and self.canvas_client_state is storage_state:
+                return self.canvas_client
+            previous = self.canvas_client
+            self.canvas_client = self.backend.CanvasHttpClient(storage_state)
+            self.canvas_client_state = storage_state
+            client = self.canvas_client
+        if previous is not None:
+            previous.dispose()
+        return client
+
+    def _dispose_canvas_client(self):
+        with self.canvas_client_lock:
+            client = self.canvas_client
+            self.canvas_client = None
+            self.canvas_client_state = None
+        if client is not None:
+            try:
+                client.dispose()
+            except Exception:
+                pass
+
     def _save_canvas_session(self):
         if self.storage_state is None:
             return
@@ -1612,6 +1655,9 @@ class AssignmentTrackerGUI(tk.Tk):
 
     def _clear_canvas_session(self):
         self.storage_state = None
+        self._dispose_canvas_client()
+        if self.backend is not None and hasattr(self.backend, "invalidate_canvas_cache"):
+            self.backend.invalidate_canvas_cache()
         if os.path.isfile(self.canvas_session_path):
             try:
                 os.remove(self.canvas_session_path)
@@ -1646,14 +1692,7 @@ class AssignmentTrackerGUI(tk.Tk):
             return "unreachable"
 
     def _storage_state_auth_status(self, storage_state: dict) -> str:
-        from playwright.sync_api import sync_playwright
-
-        with sync_playwright() as p:
-            api_context = p.request.new_context(storage_state=storage_state)
-            try:
-                return self._canvas_auth_status(api_context)
-            finally:
-                api_context.dispose()
+        return self._canvas_auth_status(self._canvas_api_client(storage_state))
 
     def _reload_selected_sheet_tabs(self):
         if self.backend is None:
@@ -1728,6 +1767,7 @@ class AssignmentTrackerGUI(tk.Tk):
 
             import PullFromCanvas as backend_module
             self.backend = backend_module
+            self.backend.DEBUG_ARTIFACTS.set_level(self.app_settings.get("debug_artifacts", "summary"))
 
             self._load_sheet_registry()
 
@@ -1892,6 +1932,7 @@ class AssignmentTrackerGUI(tk.Tk):
         while (time.monotonic() - started) < timeout_seconds:
             if self.backend._is_canvas_authenticated(self.context.request):
                 self.storage_state = self.context.storage_state()
+                self.backend.invalidate_canvas_cache()
                 self._save_canvas_session()
                 self._set_status("Signed in. Ready to sync.")
                 self._set_login_hint("Sign-in detected.")
@@ -1908,7 +1949,7 @@ class AssignmentTrackerGUI(tk.Tk):
         self._set_reopen_login_enabled(True)
         self._log("Canvas login timed out. Browser closed; use 'Reopen browser' to retry.")
 
-    def _start_sync(self, include_past: bool, dry_run: bool, replace_existing: bool):
+    def _start_sync(self, include_past: bool, dry_run: bool, replace_existing: bool, force_refresh: bool = False):
         if self.sync_running:
             self._log("An operation is already running. Please wait.")
             return
@@ -1920,7 +1961,7 @@ class AssignmentTrackerGUI(tk.Tk):
         self._set_status("Sync running...")
         threading.Thread(
             target=self._run_sync_worker,
-            args=(include_past, dry_run, replace_existing, None),
+            args=(include_past, dry_run, replace_existing, None, force_refresh),
             daemon=True,
         ).start()
 
@@ -1936,7 +1977,7 @@ class AssignmentTrackerGUI(tk.Tk):
         self._set_status(f"Syncing {class_tab}...")
         threading.Thread(
             target=self._run_sync_worker,
-            args=(True, False, False, [class_tab]),
+            args=(True, False, False, [class_tab], False),
             daemon=True,
         ).start()
 
@@ -2003,84 +2044,104 @@ class AssignmentTrackerGUI(tk.Tk):
         dry_run: bool,
         replace_existing: bool,
         selected_tabs: list[str] | None,
+        force_refresh: bool = False,
     ):
         writer = QueueWriter(self.log_queue)
         try:
-            from playwright.sync_api import sync_playwright
-
             with redirect_stdout(writer), redirect_stderr(writer):
                 if self.storage_state is None:
                     raise RuntimeError("No Canvas login session available. Please sign in again.")
 
                 storage_state = self.storage_state
 
-                with sync_playwright() as p:
-                    api_context = p.request.new_context(storage_state=storage_state)
-
-                    auth_status = self._canvas_auth_status(api_context)
-                    if auth_status != "authenticated":
-                        if auth_status == "unauthenticated":
-                            self._clear_canvas_session()
-                            raise RuntimeError(
-                                "Canvas session expired. Click 'Reopen browser' from the sign-in panel to login again."
-                            )
+                api_context = self._canvas_api_client(storage_state)
+                auth_status = self._canvas_auth_status(api_context)
+                if auth_status != "authenticated":
+                    if auth_status == "unauthenticated":
+                        self._clear_canvas_session()
                         raise RuntimeError(
-                            "Could not verify Canvas session (network unavailable). Check your connection and retry."
+                            "Canvas session expired. Click 'Reopen browser' from the sign-in panel to login again."
                         )
+                    raise RuntimeError(
+                        "Could not verify Canvas session (network unavailable). Check your connection and retry."
+                    )
 
-                    class RequestContextShim:
-                        def __init__(self, request):
-                            self.request = request
-
-                    shim = RequestContextShim(api_context)
-
-                    patterns_to_use = self.sheet_patterns
-                    if selected_tabs:
-                        selected_set = set(selected_tabs)
-                        patterns_to_use = [
-                            pattern
-                            for pattern in (self.sheet_patterns or [])
-                            if pattern.get("tab_name") in selected_set
-                        ]
-                        if not patterns_to_use:
-                            raise RuntimeError(
-                                f"No sheet pattern found for selected tab(s): {', '.join(selected_tabs)}"
-                            )
-
-                    if selected_tabs:
-                        print(f"Sync limited to tab(s): {', '.join(selected_tabs)}")
+                class RequestContextShim:
+                    def __init__(self, request, storage_state):
+                        self.request = request
+                        self.storage_state = storage_state
+
+                shim = RequestContextShim(api_context, storage_state)
+
+                patterns_to_use = self.sheet_patterns
+                if selected_tabs:
+                    selected_set = set(selected_tabs)
+                    patterns_to_use = [
+                        pattern
+                        for pattern in (self.sheet_patterns or [])
+                        if pattern.get("tab_name") in selected_set
+                    ]
+                    if not patterns_to_use:
+                        raise RuntimeError(
+                            f"No sheet pattern found for selected tab(s): {', '.join(selected_tabs)}"
+                        )
 
+                if selected_tabs:
+                    print(f"Sync limited to tab(s): {', '.join(selected_tabs)}")
+
+                fetch_report: dict = {}
+                fetch_options = {
+                    "include_past_assignments": include_past,
+                    "force_refresh": force_refresh,
+                    "engine": self.app_settings.get("canvas_fetch_engine", "rest"),
+                    "resolve_overrides": self.app_settings.get("resolve_due_date_overrides", False),
+                    "fetch_report": fetch_report,
+                }
+
+                if self.app_settings.get("pipelined_sync", True):
+                    # Each class tab is written as soon as its courses are fetched.
+                    assignments_by_class, sync_response = self.backend.sync_assignments_pipelined(
+                        self.backend.iter_assignments_by_class(shim, patterns_to_use, **fetch_options),
+                        dry_run=dry_run,
+                        replace_existing=replace_existing,
+                        fetch_report=fetch_report,
+                        sheet_names=[pattern.get("tab_name") for pattern in patterns_to_use if pattern.get("tab_name")],
+                    )
+                else:
                     assignments_by_class = self.backend.fetch_assignments_from_canvas_context(
                         shim,
                         patterns_to_use,
-                        include_past_assignments=include_past,
+                        **fetch_options,
                     )
+                    sync_response = None
 
-                    file_count = self.backend.write_outputs_by_class(assignments_by_class, self.backend.OUTPUT_DIR)
+                file_count = self.backend.write_outputs_by_class(assignments_by_class, self.backend.OUTPUT_DIR)
+                if file_count:
                     total_assignments = sum(len(records) for records in assignments_by_class.values())
-                    print(f"Saved {total_assignments} assignments into {file_count} file(s) in '{self.backend.OUTPUT_DIR}'.")
+                    print(f"Saving {total_assignments} assignments into {file_count} file(s) in '{self.backend.OUTPUT_DIR}'.")
 
+                if sync_response is None:
                     sync_response = self.backend.sync_assignments_to_sheet(
                         assignments_by_class,
                         dry_run=dry_run,
                         replace_existing=replace_existing,
+                        fetch_report=fetch_report,
                     )
 
+                if self.backend.DEBUG_ARTIFACTS.enabled("summary"):
                     print(f"Sheet sync response saved to {self.backend.SHEET_SYNC_RESPONSE_FILE}")
-                    print(f"Sheet sync status: {sync_response.get('status', 'unknown')}")
-                    print(f"Rows written: {sync_response.get('rowsWritten', 0)}")
-                    if sync_response.get("dryRun"):
-                        print("Dry run mode: no spreadsheet changes were made.")
-                    for message in sync_response.get("debugMessages", []):
-                        print(message)
-                    for class_name, stats in sync_response.get("classStats", {}).items():
-                        print(
-                            f"[{class_name}] incoming={stats.get('incomingCount', 0)} "
-                            f"existing={stats.get('existingNamedCount', 0)} matched={stats.get('matchedCount', 0)} "
-                            f"added={stats.get('addedCount', 0)} updated={stats.get('updatedCount', 0)}"
-                        )
-
-                    api_context.dispose()
+                print(f"Sheet sync status: {sync_response.get('status', 'unknown')}")
+                print(f"Rows written: {sync_response.get('rowsWritten', 0)}")
+                if sync_response.get("dryRun"):
+                    print("Dry run mode: no spreadsheet changes were made.")
+                for message in sync_response.get("debugMessages", []):
+                    print(message)
+                for class_name, stats in sync_response.get("classStats", {}).items():
+                    print(
+                        f"[{class_name}] incoming={stats.get('incomingCount', 0)} "
+                        f"existing={stats.get('existingNamedCount', 0)} matched={stats.get('matchedCount', 0)} "
+                        f"added={stats.get('addedCount', 0)} updated={stats.get('updatedCount', 0)}"
+                    )
 
             self._set_status("Sync completed")
         except Exception as error:
@@ -2115,6 +2176,9 @@ class AssignmentTrackerGUI(tk.Tk):
             self.remove_sheet_tooltip = None
 
         self._dispose_login_browser()
+        self._dispose_canvas_client()
+        if self.backend is not None:
+            self.backend.DEBUG_ARTIFACTS.flush()
 
         self.destroy()
 
@@ -2,14 +2,29 @@
 # & ".\.venv\Scripts\python.exe" ".\PullFromCanvas.py"
 import os
 import re
+import gzip
+import http.client
+import http.cookies
 import json
+import queue
+import random
 import sys
-from datetime import datetime
+import threading
+import time
+import urllib.parse
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from playwright.sync_api import sync_playwright
 from keys import CANVAS_BASE_URL, SHEET_API_URL
 
 
 LOGIN_URL = f"{CANVAS_BASE_URL}/login/saml"
+CANVAS_GRAPHQL_URL = f"{CANVAS_BASE_URL}/api/graphql"
+CANVAS_COURSES_URL = (
+	f"{CANVAS_BASE_URL}/api/v1/courses"
+	"?per_page=100&enrollment_state=active&state[]=available&include[]=total_scores"
+)
 CURRENT_SHEET_URL = SHEET_API_URL
 CURRENT_SPREADSHEET_ID = ""
 OUTPUT_DIR = "outputs"
@@ -17,6 +32,8 @@ SHEET_CLASSES_DEBUG_FILE = os.path.join(OUTPUT_DIR, "sheet_classes_debug.txt")
 SHEET_SYNC_RESPONSE_FILE = os.path.join(OUTPUT_DIR, "sheet_sync_response.json")
 CANVAS_ASSIGNMENTS_DEBUG_FILE = os.path.join(OUTPUT_DIR, "canvas_assignments_debug.json")
 EXCLUDED_TAB_NAMES = {"dashboard", "class[template]"}
+DEBUG_ARTIFACT_LEVELS = ("off", "summary", "full")
+DEBUG_ARTIFACT_LEVEL = "summary"
 GOOGLE_SHEETS_SCOPES = [
 	"https://www.googleapis.com/auth/spreadsheets",
 	"https://www.googleapis.com/auth/drive.file",
@@ -28,10 +45,58 @@ GOOGLE_USERINFO_SCOPES = [
 ]
 TEMPLATE_SHEET_ID = "17W5u-FZ-bq8ciiSIgSRu7B255P1kheF_G30hGUedHuU"
 GOOGLE_TOKEN_FILE = "google_sheets_token.local.json"
+GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS = 300
+SHEETS_MAX_BATCH_BYTES = 2_000_000
+SHEETS_COPY_MAX_WORKERS = 4
+SHEET_MIRROR_MAX_AGE_SECONDS = 300.0
+SHEETS_PIPELINE_FLUSH_CLASSES = 2
+SHEETS_PIPELINE_FLUSH_SECONDS = 15.0
+SPREADSHEET_PROBE_INTERVAL_SECONDS = 5.0
+SPREADSHEET_METADATA_FIELDS = "properties.title,sheets.properties(sheetId,title,index)"
 GOOGLE_CLIENT_SECRET_CANDIDATES = (
 	"google_oauth_client_secret.json",
 	"client_secret.json",
 )
+CANVAS_MAX_IN_FLIGHT = 4
+CANVAS_FETCH_ENGINES = ("rest", "graphql")
+CANVAS_FETCH_ENGINE = "rest"
+CANVAS_GRAPHQL_PAGE_SIZE = 100
+CANVAS_CALENDAR_CONTEXTS_PER_REQUEST = 10
+CANVAS_CALENDAR_END_DATE = "2100-01-01"
+ASSIGNMENT_FIELDS = ("id", "name", "due_at", "html_url")
+CALENDAR_EVENT_FIELDS = (
+	"id",
+	"title",
+	"start_at",
+	"end_at",
+	"html_url",
+	"context_code",
+	*(f"assignment.{field}" for field in ASSIGNMENT_FIELDS),
+)
+CANVAS_CACHE_FILE = "canvas_response_cache.local.json.gz"
+CANVAS_CACHE_TTL_SECONDS = {
+	"courses": 6 * 60 * 60,
+	"assignments": 5 * 60,
+	"calendar_events": 5 * 60,
+}
+CANVAS_CACHE_GRACE_SECONDS = 24 * 60 * 60
+CANVAS_CACHE_MAX_AGE_SECONDS = 14 * 24 * 60 * 60
+CANVAS_CACHE_MAX_ENTRIES = 2000
+CANVAS_HTTP_POOL_SIZE = 8
+CANVAS_HTTP_TIMEOUT_SECONDS = 30.0
+CANVAS_HTTP_MAX_REDIRECTS = 5
+CANVAS_AUTH_CACHE_SECONDS = 120.0
+CANVAS_RATE_LIMIT_FLOOR = 150.0
+CANVAS_RATE_LIMIT_REFILL_PER_SECOND = 10.0
+CANVAS_RATE_LIMIT_PREFLIGHT_COST = 50.0
+CANVAS_RATE_LIMIT_MAX_RETRIES = 5
+CANVAS_RATE_LIMIT_BACKOFF_SECONDS = 1.0
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8.0
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN_SECONDS = 30.0
 
 
 def _project_dir() -> str:
@@ -97,6 +162,10 @@ def parse_spreadsheet_id(sheet_url: str) -> str:
 
 def reset_google_login() -> None:
 	"""Clear cached Google OAuth token so next Google API call re-prompts sign-in."""
+	GOOGLE_CREDENTIALS.reset()
+	SPREADSHEET_METADATA.invalidate()
+	SHEET_MIRROR.invalidate()
+	SPREADSHEET_CHANGES.forget()
 	token_path = _token_path()
 	if os.path.isfile(token_path):
 		os.remove(token_path)
@@ -109,10 +178,7 @@ def validate_google_sheet_access(sheet_url: str) -> bool:
 		raise RuntimeError("Invalid Google Sheet URL.")
 
 	service = _google_sheets_service()
-	service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="spreadsheetId,properties.title",
-	).execute()
+	SPREADSHEET_METADATA.get(service, spreadsheet_id, refresh=True)
 	return True
 
 
@@ -137,6 +203,112 @@ def get_sheet_api_url() -> str:
 	return CURRENT_SHEET_URL
 
 
+class HostResilience:
+	"""Per-host circuit breakers and retry counters shared by Canvas and Google calls.
+
+	A host that fails CIRCUIT_FAILURE_THRESHOLD times in a row is skipped for
+	CIRCUIT_COOLDOWN_SECONDS, after which one trial call is let through. clock and jitter
+	default to time.monotonic and random.uniform; tests pass their own.
+	"""
+
+	def __init__(self, clock=time.monotonic, jitter=random.uniform):
+		self._clock = clock
+		self._jitter = jitter
+		self._lock = threading.Lock()
+		self._hosts: dict[str, dict] = {}
+		self._stats = {"retries": 0, "retrySeconds": 0.0, "failures": 0, "circuitOpens": 0, "shortCircuited": 0}
+
+	def before_call(self, host: str) -> None:
+		with self._lock:
+			state = self._hosts.setdefault(host, {"failures": 0, "opened_at": None})
+			opened_at = state["opened_at"]
+			if opened_at is None:
+				return
+			if self._clock() - opened_at < CIRCUIT_COOLDOWN_SECONDS:
+				self._stats["shortCircuited"] += 1
+				raise RuntimeError(f"{host} is failing repeatedly; skipping calls for now.")
+			# Half-open: let this call through; one more failure re-opens the circuit.
+			state["opened_at"] = None
+			state["failures"] = CIRCUIT_FAILURE_THRESHOLD - 1
+
+	def record_success(self, host: str) -> None:
+		with self._lock:
+			self._hosts[host] = {"failures": 0, "opened_at": None}
+
+	def record_failure(self, host: str) -> None:
+		with self._lock:
+			state = self._hosts.setdefault(host, {"failures": 0, "opened_at": None})
+			state["failures"] += 1
+			self._stats["failures"] += 1
+			if state["failures"] >= CIRCUIT_FAILURE_THRESHOLD and state["opened_at"] is None:
+				state["opened_at"] = self._clock()
+				self._stats["circuitOpens"] += 1
+				print(f"Opening circuit for {host} after {state['failures']} consecutive failures.")
+
+	def backoff(self, attempt: int) -> float:
+		"""Return a full-jitter exponential delay for a retry and count it."""
+		delay = self._jitter(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2 ** attempt)))
+		with self._lock:
+			self._stats["retries"] += 1
+			self._stats["retrySeconds"] += delay
+		return delay
+
+	def snapshot(self, since: dict | None = None) -> dict:
+		"""Return the counters, or how much they grew since an earlier snapshot."""
+		with self._lock:
+			stats = {key: value - (since or {}).get(key, 0) for key, value in self._stats.items()}
+			return {
+				**stats,
+				"retrySeconds": round(stats["retrySeconds"], 3),
+				"openCircuits": sorted(host for host, state in self._hosts.items() if state["opened_at"] is not None),
+			}
+
+
+HOST_RESILIENCE = HostResilience()
+
+
+def _is_transient_google_error(error: Exception) -> bool:
+	status = getattr(getattr(error, "resp", None), "status", None)
+	if status is not None:
+		try:
+			return int(status) in RETRYABLE_STATUS_CODES
+		except (TypeError, ValueError):
+			return False
+	return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def _execute_google(request, idempotent: bool | None = None):
+	"""Execute a googleapiclient request, retrying transient failures of idempotent calls.
+
+	GET and PUT requests are idempotent by default; pass idempotent=True for POSTs that
+	overwrite the same cells (values clear/batchUpdate, formatting).
+	"""
+	host = urllib.parse.urlsplit(str(getattr(request, "uri", "") or "")).netloc or "googleapis.com"
+	if idempotent is None:
+		idempotent = str(getattr(request, "method", "GET")).upper() in ("GET", "PUT")
+
+	attempt = 0
+	while True:
+		HOST_RESILIENCE.before_call(host)
+		try:
+			result = request.execute()
+		except Exception as error:
+			if not _is_transient_google_error(error):
+				HOST_RESILIENCE.record_success(host)
+				raise
+			HOST_RESILIENCE.record_failure(host)
+			if not idempotent or attempt >= RETRY_MAX_ATTEMPTS - 1:
+				raise
+			delay = HOST_RESILIENCE.backoff(attempt)
+			print(f"Google API call failed ({error}). Retrying in {delay:.1f}s...")
+			time.sleep(delay)
+			attempt += 1
+			continue
+
+		HOST_RESILIENCE.record_success(host)
+		return result
+
+
 def _require_google_dependencies() -> None:
 	try:
 		import importlib
@@ -144,6 +316,7 @@ def _require_google_dependencies() -> None:
 		importlib.import_module("google.oauth2.credentials")
 		importlib.import_module("google_auth_oauthlib.flow")
 		importlib.import_module("googleapiclient.discovery")
+		importlib.import_module("google_auth_httplib2")
 	except Exception as error:
 		raise RuntimeError(
 			"Missing Google Sheets dependencies. Install: "
@@ -188,22 +361,146 @@ def _load_google_credentials(scopes: list[str] | None = None):
 			flow = InstalledAppFlow.from_client_secrets_file(client_secret_path, required_scopes)
 			creds = flow.run_local_server(port=0)
 
-	with open(token_path, "w", encoding="utf-8") as token_file:
-		token_file.write(creds.to_json())
-
 	return creds
 
 
-def _google_sheets_service():
-	_require_google_dependencies()
+class GoogleCredentialManager:
+	"""Process-wide Google credentials and Sheets/Drive service objects.
+
+	Credentials are loaded once and refreshed on a background timer shortly before they
+	expire. The token file is rewritten only when the token actually changes. Each discovery
+	client is built once per process; httplib2 connections are not thread-safe, so its
+	requests run on an authorized transport owned by the calling thread.
+	"""
+
+	def __init__(self):
+		self._lock = threading.RLock()
+		self._credentials: dict[frozenset[str], object] = {}
+		self._saved_token: str | None = None
+		self._refresh_timer: threading.Timer | None = None
+		self._generation = 0
+		self._services: dict[tuple[str, str], tuple[object, object]] = {}
+		self._build_lock = threading.Lock()
+		self._local = threading.local()
+
+	def credentials(self, scopes: list[str] | None = None):
+		required = frozenset(scopes or GOOGLE_SHEETS_SCOPES)
+		with self._lock:
+			creds = self._credentials.get(required)
+			if creds is None:
+				creds = next(
+					(cached for granted, cached in self._credentials.items() if required.issubset(granted)),
+					None,
+				)
+			if creds is None or not creds.valid:
+				creds = _load_google_credentials(sorted(required))
+				self._credentials[frozenset(getattr(creds, "scopes", None) or required)] = creds
+				self._credentials[required] = creds
+				self._save_token(creds)
+				self._schedule_refresh(creds)
+			return creds
+
+	def service(self, api: str, version: str, scopes: list[str] | None = None):
+		creds = self.credentials(scopes)
+		key = (api, version)
+		# A separate lock keeps the discovery fetch from blocking credentials() callers.
+		with self._build_lock:
+			with self._lock:
+				cached = self._services.get(key)
+			if cached is not None and cached[0] is creds:
+				return cached[1]
+
+			_require_google_dependencies()
+			from googleapiclient.discovery import build
+			from googleapiclient.http import HttpRequest
+
+			def _request_builder(_shared_http, *args, **kwargs):
+				return HttpRequest(self._thread_http(creds), *args, **kwargs)
+
+			service = build(api, version, credentials=creds, cache_discovery=False, requestBuilder=_request_builder)
+			with self._lock:
+				self._services[key] = (creds, service)
+			return service
+
+	def _thread_http(self, creds):
+		if getattr(self._local, "generation", None) != self._generation:
+			self._local.transports = {}
+			self._local.generation = self._generation
+
+		cached = self._local.transports.get(id(creds))
+		if cached is not None and cached[0] is creds:
+			return cached[1]
+
+		from google_auth_httplib2 import AuthorizedHttp
+		from googleapiclient.http import build_http
+
+		# build_http() applies googleapiclient's default socket timeout and 308 handling.
+		http = AuthorizedHttp(creds, http=build_http())
+		self._local.transports[id(creds)] = (creds, http)
+		return http
+
+	def reset(self) -> None:
+		with self._lock:
+			self._credentials.clear()
+			self._services.clear()
+			self._saved_token = None
+			self._generation += 1
+			if self._refresh_timer is not None:
+				self._refresh_timer.cancel()
+				self._refresh_timer = None
+
+	def _save_token(self, creds) -> None:
+		token = creds.to_json()
+		if token == self._saved_token:
+			return
+		token_path = _token_path()
+		try:
+			with open(token_path, "r", encoding="utf-8") as token_file:
+				unchanged = token_file.read() == token
+		except OSError:
+			unchanged = False
+		if not unchanged:
+			with open(token_path, "w", encoding="utf-8") as token_file:
+				token_file.write(token)
+		self._saved_token = token
+
+	def _schedule_refresh(self, creds) -> None:
+		expiry = getattr(creds, "expiry", None)
+		if expiry is None or not getattr(creds, "refresh_token", None):
+			return
+		# google-auth keeps expiry as a naive UTC datetime.
+		now = datetime.now(timezone.utc).replace(tzinfo=None)
+		delay = max(0.0, (expiry - now).total_seconds() - GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS)
+		if self._refresh_timer is not None:
+			self._refresh_timer.cancel()
+		self._refresh_timer = threading.Timer(delay, self._refresh, args=(creds, self._generation))
+		self._refresh_timer.daemon = True
+		self._refresh_timer.start()
+
+	def _refresh(self, creds, generation: int) -> None:
+		import importlib
+		Request = getattr(importlib.import_module("google.auth.transport.requests"), "Request")
+		with self._lock:
+			if generation != self._generation:
+				return
+		# Refresh without the lock so credentials()/service() callers are not blocked on the network.
+		try:
+			creds.refresh(Request())
+		except Exception as error:
+			print(f"Warning: Background Google token refresh failed: {error}")
+			return
+		with self._lock:
+			if generation != self._generation:
+				return
+			self._save_token(creds)
+			self._schedule_refresh(creds)
 
-	import importlib
-	discovery_module = importlib.import_module("googleapiclient.discovery")
-	build = getattr(discovery_module, "build")
 
-	creds = _load_google_credentials(GOOGLE_SHEETS_SCOPES)
+GOOGLE_CREDENTIALS = GoogleCredentialManager()
 
-	return build("sheets", "v4", credentials=creds, cache_discovery=False)
+
+def _google_sheets_service():
+	return GOOGLE_CREDENTIALS.service("sheets", "v4", GOOGLE_SHEETS_SCOPES)
 
 
 def _require_spreadsheet_id() -> str:
@@ -217,27 +514,139 @@ def _require_spreadsheet_id() -> str:
 
 def _google_drive_service():
 	"""Get Google Drive API service using same credentials as Sheets API."""
-	_require_google_dependencies()
-	import importlib
-	discovery_module = importlib.import_module("googleapiclient.discovery")
-	build = getattr(discovery_module, "build")
+	return GOOGLE_CREDENTIALS.service("drive", "v3", GOOGLE_SHEETS_SCOPES)
+
+
+class SpreadsheetMetadataCache:
+	"""Spreadsheet title and tab properties (sheetId, title, index), fetched once per spreadsheet.
+
+	Loading a sheet's class tabs re-fetches the entry unless SPREADSHEET_CHANGES vouches that
+	the sheet is unchanged, so each operation starts from current metadata and the helpers it
+	calls afterwards reuse it. Code that adds, renames or deletes tabs calls invalidate().
+	"""
+
+	def __init__(self):
+		self._entries: dict[str, dict] = {}
+		self._lock = threading.Lock()
+
+	def get(self, service, spreadsheet_id: str, refresh: bool = False) -> dict:
+		with self._lock:
+			parsed = self._entries.get(spreadsheet_id)
+			if parsed is None or refresh:
+				parsed = _execute_google(service.spreadsheets().get(
+					spreadsheetId=spreadsheet_id,
+					fields=SPREADSHEET_METADATA_FIELDS,
+				))
+				self._entries[spreadsheet_id] = parsed
+			return parsed
+
+	def sheet_properties(self, service, spreadsheet_id: str, refresh: bool = False) -> list[dict]:
+		parsed = self.get(service, spreadsheet_id, refresh)
+		return [
+			sheet.get("properties") or {}
+			for sheet in parsed.get("sheets", [])
+			if isinstance(sheet, dict)
+		]
+
+	def invalidate(self, spreadsheet_id: str | None = None) -> None:
+		with self._lock:
+			if spreadsheet_id is None:
+				self._entries.clear()
+			else:
+				self._entries.pop(spreadsheet_id, None)
+
+
+SPREADSHEET_METADATA = SpreadsheetMetadataCache()
+
+
+class SpreadsheetChangeDetector:
+	"""Tells whether a spreadsheet changed since the app last saw it, via Drive's file version.
+
+	validate() compares Drive files.get(modifiedTime, version) with the version the local
+	caches (SHEET_MIRROR, SPREADSHEET_METADATA) were built from and drops them when someone
+	edited the sheet. After the app's own writes record_own_write() adopts the new version,
+	so those do not force a re-read. Sheets the drive.file scope cannot see return None and
+	callers re-read them.
+	"""
+
+	def __init__(self):
+		self._known: dict[str, str] = {}
+		self._probed: dict[str, tuple[float, str]] = {}
+		self._unsupported: set[str] = set()
+		self._lock = threading.Lock()
+
+	def probe(self, spreadsheet_id: str, max_age: float | None = None) -> str | None:
+		if max_age is None:
+			max_age = SPREADSHEET_PROBE_INTERVAL_SECONDS
+		with self._lock:
+			if spreadsheet_id in self._unsupported:
+				return None
+			probed = self._probed.get(spreadsheet_id)
+			if probed is not None and time.monotonic() - probed[0] <= max_age:
+				return probed[1]
+
+		try:
+			metadata = _execute_google(_google_drive_service().files().get(
+				fileId=spreadsheet_id,
+				fields="modifiedTime,version",
+				supportsAllDrives=True,
+			))
+		except Exception as error:
+			if not _is_transient_google_error(error):
+				print(f"Drive change detection unavailable for this sheet ({error}); re-reading tabs before writes.")
+				with self._lock:
+					self._unsupported.add(spreadsheet_id)
+			return None
+
+		version = f"{metadata.get('version') or ''}@{metadata.get('modifiedTime') or ''}"
+		with self._lock:
+			self._probed[spreadsheet_id] = (time.monotonic(), version)
+		return version
+
+	def validate(self, spreadsheet_id: str) -> bool | None:
+		"""True if unchanged since last seen, False if changed (caches dropped), None if unknown."""
+		version = self.probe(spreadsheet_id)
+		if version is None:
+			return None
+		with self._lock:
+			known = self._known.get(spreadsheet_id)
+			self._known[spreadsheet_id] = version
+		if known == version:
+			return True
+		SHEET_MIRROR.invalidate(spreadsheet_id)
+		SPREADSHEET_METADATA.invalidate(spreadsheet_id)
+		return False
 
-	creds = _load_google_credentials(GOOGLE_SHEETS_SCOPES)
+	def record_own_write(self, spreadsheet_id: str) -> None:
+		# An edit made between our write and this probe is missed until the next change.
+		version = self.probe(spreadsheet_id, max_age=0.0)
+		with self._lock:
+			if version is None:
+				self._known.pop(spreadsheet_id, None)
+			else:
+				self._known[spreadsheet_id] = version
+
+	def forget(self, spreadsheet_id: str | None = None) -> None:
+		with self._lock:
+			if spreadsheet_id is None:
+				self._known.clear()
+				self._probed.clear()
+				self._unsupported.clear()
+			else:
+				self._known.pop(spreadsheet_id, None)
+				self._probed.pop(spreadsheet_id, None)
+				self._unsupported.discard(spreadsheet_id)
 
-	return build("drive", "v3", credentials=creds, cache_discovery=False)
+
+SPREADSHEET_CHANGES = SpreadsheetChangeDetector()
 
 
 def _get_google_user_email() -> str:
 	"""Get the email of the currently authenticated Google user."""
 	try:
-		import importlib
-		discovery_module = importlib.import_module("googleapiclient.discovery")
-		build = getattr(discovery_module, "build")
-
 		user_scopes = GOOGLE_SHEETS_SCOPES + GOOGLE_USERINFO_SCOPES
-		creds = _load_google_credentials(user_scopes)
-		oauth_service = build("oauth2", "v2", credentials=creds, cache_discovery=False)
-		profile = oauth_service.userinfo().get().execute()
+		oauth_service = GOOGLE_CREDENTIALS.service("oauth2", "v2", user_scopes)
+		profile = _execute_google(oauth_service.userinfo().get())
 		email = str(profile.get("email") or "").strip()
 		if email:
 			return email
@@ -246,7 +655,7 @@ def _get_google_user_email() -> str:
 
 	try:
 		drive_service = _google_drive_service()
-		about = drive_service.about().get(fields="user").execute()
+		about = _execute_google(drive_service.about().get(fields="user"))
 		email = str(about.get("user", {}).get("emailAddress") or "").strip()
 		if email:
 			return email
@@ -259,7 +668,7 @@ def _get_google_user_email() -> str:
 def _get_canvas_user_display_name(canvas_context) -> str:
 	"""Get the Canvas user's preferred display name for naming generated sheets."""
 	try:
-		response = canvas_context.request.get(f"{CANVAS_BASE_URL}/api/v1/users/self")
+		response = _canvas_request(canvas_context.request, "get", f"{CANVAS_BASE_URL}/api/v1/users/self")
 		if not response.ok:
 			return ""
 		payload = response.json()
@@ -284,7 +693,7 @@ def _copy_drive_file(file_id: str, new_title: str) -> str:
 	drive_service = _google_drive_service()
 	body = {"name": new_title}
 	try:
-		copied_file = drive_service.files().copy(fileId=file_id, body=body).execute()
+		copied_file = _execute_google(drive_service.files().copy(fileId=file_id, body=body))
 		return copied_file.get("id")
 	except Exception as e:
 		raise RuntimeError(f"Failed to copy template sheet: {e}")
@@ -294,9 +703,9 @@ def _copy_template_via_sheets_api(template_spreadsheet_id: str, new_title: str)
 	"""Clone the template spreadsheet using Sheets API only (no Drive API required)."""
 	service = _google_sheets_service()
 
-	created = service.spreadsheets().create(
+	created = _execute_google(service.spreadsheets().create(
 		body={"properties": {"title": new_title}}
-	).execute()
+	))
 	new_spreadsheet_id = str(created.get("spreadsheetId") or "").strip()
 	if not new_spreadsheet_id:
 		raise RuntimeError("Could not create destination spreadsheet.")
@@ -309,25 +718,29 @@ def _copy_template_via_sheets_api(template_spreadsheet_id: str, new_title: str)
 			default_sheet_id = props.get("sheetId")
 			break
 
-	template_parsed = service.spreadsheets().get(
-		spreadsheetId=template_spreadsheet_id,
-		fields="sheets.properties.sheetId,sheets.properties.title",
-	).execute()
-
-	rename_requests: list[dict] = []
-	for template_sheet in template_parsed.get("sheets", []):
-		props = template_sheet.get("properties", {})
-		template_sheet_id = props.get("sheetId")
-		template_title = str(props.get("title") or "").strip()
-		if template_sheet_id is None or not template_title:
-			continue
+	template_sheets = [
+		(props.get("sheetId"), str(props.get("title") or "").strip())
+		for props in SPREADSHEET_METADATA.sheet_properties(service, template_spreadsheet_id)
+	]
+	template_sheets = [(sheet_id, title) for sheet_id, title in template_sheets if sheet_id is not None and title]
 
-		copied = service.spreadsheets().sheets().copyTo(
+	def _copy_tab(template_sheet_id: int):
+		# The Sheets service is shared; each worker sends through its own authorized
+		# transport (see GoogleCredentialManager), which keeps concurrent copyTo calls safe.
+		return _execute_google(_google_sheets_service().spreadsheets().sheets().copyTo(
 			spreadsheetId=template_spreadsheet_id,
 			sheetId=template_sheet_id,
 			body={"destinationSpreadsheetId": new_spreadsheet_id},
-		).execute()
+		))
+
+	copies: list[dict] = []
+	if template_sheets:
+		with ThreadPoolExecutor(max_workers=min(SHEETS_COPY_MAX_WORKERS, len(template_sheets))) as executor:
+			copies = list(executor.map(_copy_tab, [sheet_id for sheet_id, _ in template_sheets]))
 
+	# Concurrent copies land in completion order, so restore the template's tab order too.
+	rename_requests: list[dict] = []
+	for (_, template_title), copied in zip(template_sheets, copies):
 		copied_sheet_id = copied.get("sheetId")
 		if copied_sheet_id is None:
 			continue
@@ -335,10 +748,11 @@ def _copy_template_via_sheets_api(template_spreadsheet_id: str, new_title: str)
 		rename_requests.append(
 			{
 				"updateSheetProperties": {
-					"fields": "title",
+					"fields": "title,index",
 					"properties": {
 						"sheetId": copied_sheet_id,
 						"title": template_title,
+						"index": len(rename_requests),
 					},
 				}
 			}
@@ -350,75 +764,35 @@ def _copy_template_via_sheets_api(template_spreadsheet_id: str, new_title: str)
 	requests.extend(rename_requests)
 
 	if requests:
-		service.spreadsheets().batchUpdate(
+		_execute_google(service.spreadsheets().batchUpdate(
 			spreadsheetId=new_spreadsheet_id,
 			body={"requests": requests},
-		).execute()
+		))
+	SPREADSHEET_METADATA.invalidate(new_spreadsheet_id)
 
 	return new_spreadsheet_id
 
 
-def _duplicate_sheet_tab(
-	spreadsheet_id: str,
+def _duplicate_sheet_tab_request(
 	source_sheet_id: int,
 	new_tab_name: str,
 	insert_sheet_index: int | None = None,
-) -> int:
-	"""Duplicate a sheet tab and rename it. Returns the new sheet ID."""
-	service = _google_sheets_service()
-
+) -> dict:
+	"""Build a duplicateSheet request that copies a tab under a new name."""
 	duplicate_request = {
 		"sourceSheetId": source_sheet_id,
+		"newSheetName": new_tab_name,
 	}
 	if insert_sheet_index is not None:
 		duplicate_request["insertSheetIndex"] = int(insert_sheet_index)
 
-	requests = [
-		{
-			"duplicateSheet": {
-				**duplicate_request,
-			}
-		}
-	]
-	
-	response = service.spreadsheets().batchUpdate(
-		spreadsheetId=spreadsheet_id,
-		body={"requests": requests}
-	).execute()
-	
-	new_sheet_id = response["replies"][0]["duplicateSheet"]["properties"]["sheetId"]
-	
-	# Rename the new sheet
-	rename_requests = [
-		{
-			"updateSheetProperties": {
-				"fields": "title",
-				"properties": {
-					"sheetId": new_sheet_id,
-					"title": new_tab_name
-				}
-			}
-		}
-	]
-	
-	service.spreadsheets().batchUpdate(
-		spreadsheetId=spreadsheet_id,
-		body={"requests": rename_requests}
-	).execute()
-	
-	return new_sheet_id
+	return {"duplicateSheet": duplicate_request}
 
 
 def _dashboard_insert_index(spreadsheet_id: str) -> int | None:
 	"""Return the index immediately after dashboard tab, or None if dashboard is not found."""
 	service = _google_sheets_service()
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="sheets.properties.title,sheets.properties.index",
-	).execute()
-
-	for sheet in parsed.get("sheets", []):
-		props = sheet.get("properties", {})
+	for props in SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id):
 		title = str(props.get("title") or "").strip().casefold()
 		if "dashboard" in title:
 			index = props.get("index")
@@ -431,45 +805,37 @@ def _dashboard_insert_index(spreadsheet_id: str) -> int | None:
 def _get_sheet_tab_id_by_title(spreadsheet_id: str, title: str) -> int | None:
 	"""Get the sheet ID (gid) for a given sheet title."""
 	service = _google_sheets_service()
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="sheets.properties.title,sheets.properties.sheetId"
-	).execute()
+	sheets = SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id)
 
 	target = str(title or "").strip()
 	target_cf = target.casefold()
 	target_compact = re.sub(r"[^a-z0-9]+", "", target_cf)
 
 	# Pass 1: exact match.
-	for sheet in parsed.get("sheets", []):
-		sheet_title = str(sheet.get("properties", {}).get("title") or "")
+	for props in sheets:
+		sheet_title = str(props.get("title") or "")
 		if sheet_title == target:
-			return sheet.get("properties", {}).get("sheetId")
+			return props.get("sheetId")
 
 	# Pass 2: case-insensitive/whitespace-insensitive match.
-	for sheet in parsed.get("sheets", []):
-		sheet_title = str(sheet.get("properties", {}).get("title") or "")
+	for props in sheets:
+		sheet_title = str(props.get("title") or "")
 		sheet_compact = re.sub(r"[^a-z0-9]+", "", sheet_title.casefold())
 		if sheet_compact == target_compact:
-			return sheet.get("properties", {}).get("sheetId")
+			return props.get("sheetId")
 
 	# Pass 3: tolerate copy prefixes/suffixes (e.g., "Copy of class [TEMPLATE]").
-	for sheet in parsed.get("sheets", []):
-		sheet_title = str(sheet.get("properties", {}).get("title") or "")
+	for props in sheets:
+		sheet_title = str(props.get("title") or "")
 		sheet_compact = re.sub(r"[^a-z0-9]+", "", sheet_title.casefold())
 		if target_compact and target_compact in sheet_compact:
-			return sheet.get("properties", {}).get("sheetId")
+			return props.get("sheetId")
 
 	return None
 
 
-def _fetch_canvas_enrolled_courses(canvas_context) -> list[str]:
+def _fetch_canvas_enrolled_courses(canvas_context, force_refresh: bool = False) -> list[str]:
 	"""Fetch list of course names the user is enrolled in from Canvas."""
-	courses_url = (
-		f"{CANVAS_BASE_URL}/api/v1/courses"
-		"?per_page=100&enrollment_state=active&state[]=available&include[]=total_scores"
-	)
-
 	def _should_ignore_generated_course(name: str) -> bool:
 		normalized = re.sub(r"[^a-z0-9]+", " ", str(name or "").casefold()).strip()
 		return normalized in {
@@ -522,9 +888,7 @@ def _fetch_canvas_enrolled_courses(canvas_context) -> list[str]:
 			return 1
 		return 1
 
-	print("Fetching Canvas courses...")
-	courses = _fetch_all_pages(canvas_context.request, courses_url)
-	current_courses = [course for course in courses if isinstance(course, dict) and _is_current_canvas_course(course)]
+	current_courses = CANVAS_COURSE_CATALOG.current_courses(canvas_context.request, force_refresh)
 
 	selected_by_base: dict[str, dict] = {}
 	base_order: list[str] = []
@@ -556,41 +920,38 @@ def _fetch_canvas_enrolled_courses(canvas_context) -> list[str]:
 	return course_names
 
 
-def _write_classes_to_sheet(spreadsheet_id: str, class_names: list[str]) -> None:
-	"""Write class names to Dashboard!G2:G9 (dashboard sheet only)."""
+def _class_list_request(spreadsheet_id: str, class_names: list[str]) -> dict:
+	"""Build an updateCells request writing class names to Dashboard!G2:G9 (dashboard sheet only)."""
 	service = _google_sheets_service()
 
 	# Locate dashboard sheet; fall back to first tab if needed.
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="sheets.properties.title,sheets.properties.sheetId"
-	).execute()
-
-	sheets = parsed.get("sheets", [])
-	dashboard_title = ""
-	for sheet in sheets:
-		title = str(sheet.get("properties", {}).get("title") or "").strip()
-		if "dashboard" in title.casefold():
-			dashboard_title = title
-			break
+	sheets = SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id)
+	dashboard_title = _find_dashboard_sheet_title(service, spreadsheet_id)
+	dashboard = next((props for props in sheets if str(props.get("title") or "").strip() == dashboard_title), None)
+	if dashboard is None:
+		dashboard = sheets[0] if sheets else None
+	if dashboard is None or dashboard.get("sheetId") is None:
+		raise RuntimeError("Could not find a dashboard tab to write class names to.")
 
-	if not dashboard_title:
-		dashboard_title = str(sheets[0].get("properties", {}).get("title") or "Dashboard") if sheets else "Dashboard"
-	
 	# Prepare data for G2:G9
-	values = [[class_names[i] if i < len(class_names) else ""] for i in range(8)]
-	
-	range_name = f"{_quote_sheet_name(dashboard_title)}!G2:G9"
-	body = {"values": values}
-	
-	service.spreadsheets().values().update(
-		spreadsheetId=spreadsheet_id,
-		range=range_name,
-		valueInputOption="RAW",
-		body=body
-	).execute()
-	
-	print(f"Wrote {len(class_names)} classes to {range_name}")
+	rows = [
+		{"values": [{"userEnteredValue": {"stringValue": class_names[i]}} if i < len(class_names) else {}]}
+		for i in range(8)
+	]
+
+	return {
+		"updateCells": {
+			"range": {
+				"sheetId": dashboard["sheetId"],
+				"startRowIndex": 1,
+				"endRowIndex": 9,
+				"startColumnIndex": 6,
+				"endColumnIndex": 7,
+			},
+			"rows": rows,
+			"fields": "userEnteredValue",
+		}
+	}
 
 
 def generate_formatted_sheet_from_template(canvas_context) -> str:
@@ -600,9 +961,8 @@ def generate_formatted_sheet_from_template(canvas_context) -> str:
 	1. Copy the template sheet
 	2. Rename it to "assignment tracker [username]"
 	3. Fetch Canvas courses
-	4. Write course names to G2:G9
-	5. Duplicate [TEMPLATE] tab for each course
-	6. Rename each tab to the course name
+	4. Write course names to G2:G9 and duplicate the [TEMPLATE] tab once per course,
+	   named after the course, in one batchUpdate
 	
 	Returns: The new spreadsheet URL
 	"""
@@ -637,27 +997,33 @@ def generate_formatted_sheet_from_template(canvas_context) -> str:
 		# Limit to 8 courses (G2:G9 has 8 cells)
 		course_names = course_names[:8]
 		
-		# Write classes to sheet
-		_write_classes_to_sheet(new_sheet_id, course_names)
-		
 		# Get template tab ID
 		template_tab_id = _get_sheet_tab_id_by_title(new_sheet_id, "class [TEMPLATE]")
 		if template_tab_id is None:
 			raise RuntimeError("Template tab 'class [TEMPLATE]' not found in copied sheet.")
 
 		insert_index = _dashboard_insert_index(new_sheet_id)
-		
-		# Duplicate template tab for each course and rename
+
+		# Write classes to G2:G9 and create one tab per course in a single batchUpdate.
+		requests = [_class_list_request(new_sheet_id, course_names)]
+		for offset, course_name in enumerate(course_names):
+			requests.append(
+				_duplicate_sheet_tab_request(
+					template_tab_id,
+					course_name,
+					insert_sheet_index=None if insert_index is None else insert_index + offset,
+				)
+			)
+
 		print(f"Creating {len(course_names)} class tabs...")
+		service = _google_sheets_service()
+		_execute_google(service.spreadsheets().batchUpdate(
+			spreadsheetId=new_sheet_id,
+			body={"requests": requests},
+		))
+		SPREADSHEET_METADATA.invalidate(new_sheet_id)
+		print(f"Wrote {len(course_names)} classes to Dashboard!G2:G9")
 		for course_name in course_names:
-			_duplicate_sheet_tab(
-				new_sheet_id,
-				template_tab_id,
-				course_name,
-				insert_sheet_index=insert_index,
-			)
-			if insert_index is not None:
-				insert_index += 1
 			print(f"  Created tab: {course_name}")
 		
 		# Build sheet URL
@@ -678,39 +1044,786 @@ SYNC_MODES = {
 }
 
 
-def _extract_next_link(link_header: str | None) -> str | None:
-	if not link_header:
+class CanvasAuthTracker:
+	"""Last known Canvas sign-in state for one client, fed by every response it returns.
+
+	Any successful Canvas response counts as proof of authentication for
+	CANVAS_AUTH_CACHE_SECONDS. A 401, or a 403 from /users/self, drops it. Other 403s
+	mean a forbidden resource or throttling, not a signed-out session.
+	"""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._confirmed_at: float | None = None
+
+	def observe(self, url: str, response) -> None:
+		status = int(getattr(response, "status", 0) or 0)
+		with self._lock:
+			if 200 <= status < 400:
+				self._confirmed_at = time.monotonic()
+			elif status == 401 or (status == 403 and "/api/v1/users/self" in url):
+				self._confirmed_at = None
+
+	def is_authenticated(self) -> bool:
+		with self._lock:
+			return self._confirmed_at is not None and time.monotonic() - self._confirmed_at < CANVAS_AUTH_CACHE_SECONDS
+
+	def reset(self) -> None:
+		with self._lock:
+			self._confirmed_at = None
+
+
+class CanvasHttpResponse:
+	"""The parts of Playwright's APIResponse the Canvas fetchers read."""
+
+	def __init__(self, url: str, status: int, status_text: str, headers: dict[str, str], payload: bytes):
+		self.url = url
+		self.status = status
+		self.status_text = status_text
+		self.headers = headers
+		self._payload = payload
+
+	@property
+	def ok(self) -> bool:
+		return 200 <= self.status < 300
+
+	def body(self) -> bytes:
+		return self._payload
+
+	def text(self) -> str:
+		return self._payload.decode("utf-8", errors="replace")
+
+	def json(self):
+		return json.loads(self._payload)
+
+	def dispose(self) -> None:
 		return None
 
+
+class CanvasHttpClient:
+	"""Canvas API client over pooled keep-alive connections, authenticated from a storage_state.
+
+	It stands in for a Playwright request context (get/post/dispose) without starting the
+	Node driver, so Playwright is only needed for interactive login. Cookies set by Canvas
+	during the session are kept in memory. Unlike Playwright objects it can be shared across
+	threads. Requests are sent one at a time per connection; http.client has no pipelining.
+	"""
+
+	thread_safe = True
+
+	def __init__(self, storage_state: dict | None, timeout: float = CANVAS_HTTP_TIMEOUT_SECONDS):
+		state = storage_state if isinstance(storage_state, dict) else {}
+		self._lock = threading.Lock()
+		self._cookies = [dict(cookie) for cookie in state.get("cookies") or [] if isinstance(cookie, dict)]
+		self._origins = list(state.get("origins") or [])
+		self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+		self._timeout = timeout
+		self.auth = CanvasAuthTracker()
+
+	def storage_state(self) -> dict:
+		with self._lock:
+			return {"cookies": [dict(cookie) for cookie in self._cookies], "origins": list(self._origins)}
+
+	def get(self, url: str, headers: dict | None = None) -> CanvasHttpResponse:
+		return self._request("GET", url, None, headers)
+
+	def post(self, url: str, data: str | bytes | None = None, headers: dict | None = None) -> CanvasHttpResponse:
+		return self._request("POST", url, data, headers)
+
+	def dispose(self) -> None:
+		with self._lock:
+			idle = [connection for connections in self._idle.values() for connection in connections]
+			self._idle.clear()
+		for connection in idle:
+			connection.close()
+
+	def _cookie_header(self, host: str, path: str, secure: bool) -> str:
+		now = time.time()
+		pairs = []
+		with self._lock:
+			for cookie in self._cookies:
+				domain = str(cookie.get("domain") or "").lower()
+				bare_domain = domain.lstrip(".")
+				if domain.startswith("."):
+					if host != bare_domain and not host.endswith(f".{bare_domain}"):
+						continue
+				elif host != bare_domain:
+					continue
+				if not path.startswith(str(cookie.get("path") or "/")):
+					continue
+				if cookie.get("secure") and not secure:
+					continue
+				expires = float(cookie.get("expires", -1) or -1)
+				if 0 < expires < now:
+					continue
+				pairs.append(f"{cookie.get('name')}={cookie.get('value')}")
+		return "; ".join(pairs)
+
+	def _store_cookies(self, host: str, set_cookie_headers: list[str]) -> None:
+		for header in set_cookie_headers:
+			parsed = http.cookies.SimpleCookie()
+			try:
+				parsed.load(header)
+			except http.cookies.CookieError:
+				continue
+
+			for name, morsel in parsed.items():
+				domain = morsel["domain"].lower() or host
+				if morsel["domain"] and not domain.startswith("."):
+					domain = f".{domain}"
+				path = morsel["path"] or "/"
+				expires = -1.0
+				if morsel["max-age"]:
+					try:
+						expires = time.time() + int(morsel["max-age"])
+					except ValueError:
+						pass
+				elif morsel["expires"]:
+					try:
+						expires = parsedate_to_datetime(morsel["expires"]).timestamp()
+					except (TypeError, ValueError):
+						pass
+
+				with self._lock:
+					self._cookies = [
+						cookie
+						for cookie in self._cookies
+						if (cookie.get("name"), cookie.get("domain"), cookie.get("path")) != (name, domain, path)
+					]
+					if expires == -1.0 or expires > time.time():
+						self._cookies.append(
+							{
+								"name": name,
+								"value": morsel.value,
+								"domain": domain,
+								"path": path,
+								"expires": expires,
+								"httpOnly": bool(morsel["httponly"]),
+								"secure": bool(morsel["secure"]),
+								"sameSite": morsel["samesite"] or "Lax",
+							}
+						)
+
+	def _checkout(self, key: tuple[str, str, int]) -> tuple[http.client.HTTPConnection, bool]:
+		with self._lock:
+			idle = self._idle.get(key)
+			if idle:
+				return idle.pop(), True
+		scheme, host, port = key
+		connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+		return connection_class(host, port, timeout=self._timeout), False
+
+	def _checkin(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+		with self._lock:
+			idle = self._idle.setdefault(key, [])
+			if len(idle) < CANVAS_HTTP_POOL_SIZE:
+				idle.append(connection)
+				return
+		connection.close()
+
+	def _send(self, key, method: str, target: str, body: bytes | None, headers: dict) -> tuple[int, str, list, bytes]:
+		while True:
+			connection, reused = self._checkout(key)
+			try:
+				connection.request(method, target, body=body, headers=headers)
+				response = connection.getresponse()
+				payload = response.read()
+			except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+				connection.close()
+				if reused:
+					# The server closed an idle keep-alive connection; retry on a fresh one.
+					continue
+				raise
+			except Exception:
+				connection.close()
+				raise
+
+			if response.will_close:
+				connection.close()
+			else:
+				self._checkin(key, connection)
+			return response.status, response.reason, response.getheaders(), payload
+
+	def _request(
+		self,
+		method: str,
+		url: str,
+		data: str | bytes | None,
+		headers: dict | None,
+		redirects: int = CANVAS_HTTP_MAX_REDIRECTS,
+	) -> CanvasHttpResponse:
+		parts = urllib.parse.urlsplit(url)
+		scheme = parts.scheme.lower()
+		host = (parts.hostname or "").lower()
+		port = parts.port or (443 if scheme == "https" else 80)
+		path = parts.path or "/"
+		target = f"{path}?{parts.query}" if parts.query else path
+
+		request_headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+		cookie_header = self._cookie_header(host, path, scheme == "https")
+		if cookie_header:
+			request_headers["Cookie"] = cookie_header
+		request_headers.update(headers or {})
+		body = data.encode("utf-8") if isinstance(data, str) else data
+
+		status, reason, header_items, payload = self._send((scheme, host, port), method, target, body, request_headers)
+
+		response_headers: dict[str, str] = {}
+		set_cookie_headers: list[str] = []
+		for name, value in header_items:
+			lowered = name.lower()
+			if lowered == "set-cookie":
+				set_cookie_headers.append(value)
+			elif lowered in response_headers:
+				response_headers[lowered] = f"{response_headers[lowered]}, {value}"
+			else:
+				response_headers[lowered] = value
+		self._store_cookies(host, set_cookie_headers)
+
+		location = response_headers.get("location")
+		if status in (301, 302, 303, 307, 308) and location and redirects > 0:
+			if status == 303 or (status in (301, 302) and method == "POST"):
+				method, data = "GET", None
+			return self._request(method, urllib.parse.urljoin(url, location), data, headers, redirects - 1)
+
+		if response_headers.get("content-encoding", "").lower() == "gzip" and payload:
+			payload = gzip.decompress(payload)
+		return CanvasHttpResponse(url, status, reason, response_headers, payload)
+
+
+def _parse_link_header(link_header: str | None) -> dict[str, str]:
+	"""Map each rel of a Canvas Link header to its URL."""
+	links: dict[str, str] = {}
+	if not link_header:
+		return links
+
 	for part in link_header.split(","):
 		sections = [section.strip() for section in part.split(";")]
 		if len(sections) < 2:
 			continue
 		link_part = sections[0]
-		rel_part = sections[1]
-		if rel_part == 'rel="next"' and link_part.startswith("<") and link_part.endswith(">"):
-			return link_part[1:-1]
+		rel_match = re.fullmatch(r'rel="([^"]+)"', sections[1])
+		if rel_match and link_part.startswith("<") and link_part.endswith(">"):
+			links.setdefault(rel_match.group(1), link_part[1:-1])
 
-	return None
+	return links
 
 
-def _fetch_all_pages(api_context, url: str) -> list[dict]:
-	all_items: list[dict] = []
-	next_url = url
+def _extract_next_link(link_header: str | None) -> str | None:
+	return _parse_link_header(link_header).get("next")
 
-	while next_url:
-		response = api_context.get(next_url)
-		if not response.ok:
-			raise RuntimeError(f"Canvas API request failed: {response.status} {response.status_text}")
 
-		items = response.json()
-		if isinstance(items, list):
-			all_items.extend(items)
+def _numbered_page_urls(link_header: str | None) -> list[str] | None:
+	"""List the URLs from rel="next" through rel="last" when Canvas pages by number.
+
+	Returns None for bookmark-style cursors, which can only be followed one page at a time.
+	"""
+	links = _parse_link_header(link_header)
+	next_url = links.get("next")
+	last_url = links.get("last")
+	if not next_url or not last_url:
+		return None
+
+	page_pattern = re.compile(r"(?<=[?&])page=(\d+)(?=&|$)")
+	next_match = page_pattern.search(next_url)
+	last_match = page_pattern.search(last_url)
+	if not next_match or not last_match:
+		return None
+	if page_pattern.sub("page=", next_url) != page_pattern.sub("page=", last_url):
+		return None
+
+	first_page = int(next_match.group(1))
+	last_page = int(last_match.group(1))
+	if last_page < first_page:
+		return None
+	return [
+		f"{next_url[:next_match.start()]}page={page}{next_url[next_match.end():]}"
+		for page in range(first_page, last_page + 1)
+	]
+
+
+class CanvasResponseCache:
+	"""URL-keyed copy of Canvas API pages plus the ETag/Last-Modified validators they came with.
+
+	Pages are persisted gzip-compressed under the state directory so validators and
+	TTL-fresh pages survive restarts. save() prunes pages that have not been used for a
+	while (see _prune) so URLs the app no longer requests do not accumulate.
+	"""
+
+	def __init__(self, path: str | None = None):
+		self._path = path
+		self._entries: dict[str, dict] = {}
+		self._loaded = False
+		self._dirty = False
+		self._lock = threading.RLock()
+
+	def _cache_path(self) -> str:
+		return self._path or os.path.join(_state_dir(), CANVAS_CACHE_FILE)
+
+	def _ensure_loaded(self) -> None:
+		if self._loaded:
+			return
+		self._loaded = True
+		try:
+			with gzip.open(self._cache_path(), "rt", encoding="utf-8") as file:
+				data = json.load(file)
+		except Exception:
+			return
+		if isinstance(data, dict) and isinstance(data.get("entries"), dict):
+			self._entries = data["entries"]
+
+	def get(self, url: str) -> dict | None:
+		with self._lock:
+			self._ensure_loaded()
+			return self._entries.get(url)
+
+	def is_fresh(self, url: str, entry: dict | None) -> bool:
+		if not entry:
+			return False
+		ttl = CANVAS_CACHE_TTL_SECONDS.get(_canvas_endpoint_class(url), 0)
+		return ttl > 0 and (time.time() - float(entry.get("fetched_at") or 0)) < ttl
+
+	def conditional_headers(self, entry: dict | None) -> dict[str, str]:
+		if not entry:
+			return {}
+		headers: dict[str, str] = {}
+		if entry.get("etag"):
+			headers["If-None-Match"] = entry["etag"]
+		if entry.get("last_modified"):
+			headers["If-Modified-Since"] = entry["last_modified"]
+		return headers
+
+	def store(
+		self,
+		url: str,
+		etag: str | None,
+		last_modified: str | None,
+		items: list,
+		link_header: str | None,
+		fields: list[str] | None = None,
+	) -> None:
+		with self._lock:
+			self._ensure_loaded()
+			self._entries[url] = {
+				"etag": etag,
+				"last_modified": last_modified,
+				"items": items,
+				"link": link_header,
+				"fields": fields,
+				"fetched_at": time.time(),
+			}
+			self._dirty = True
+
+	def touch(self, url: str) -> None:
+		"""Mark a cached page as freshly validated (after a 304)."""
+		with self._lock:
+			entry = self._entries.get(url)
+			if entry is not None:
+				entry["fetched_at"] = time.time()
+				self._dirty = True
+
+	def _prune(self) -> None:
+		"""Drop pages that have not been fetched or revalidated recently.
+
+		Pages without a validator go once the longest TTL plus CANVAS_CACHE_GRACE_SECONDS has
+		passed, pages with one after CANVAS_CACHE_MAX_AGE_SECONDS. Beyond that only the
+		CANVAS_CACHE_MAX_ENTRIES most recent pages are kept.
+		"""
+		now = time.time()
+		unvalidated_limit = max(CANVAS_CACHE_TTL_SECONDS.values(), default=0) + CANVAS_CACHE_GRACE_SECONDS
+
+		def _keep(entry: dict) -> bool:
+			age = now - float(entry.get("fetched_at") or 0)
+			if entry.get("etag") or entry.get("last_modified"):
+				return age <= CANVAS_CACHE_MAX_AGE_SECONDS
+			return age <= unvalidated_limit
+
+		kept = sorted(
+			((url, entry) for url, entry in self._entries.items() if isinstance(entry, dict) and _keep(entry)),
+			key=lambda item: float(item[1].get("fetched_at") or 0),
+			reverse=True,
+		)[:CANVAS_CACHE_MAX_ENTRIES]
+		self._entries = dict(kept)
+
+	def save(self) -> None:
+		with self._lock:
+			if not self._dirty:
+				return
+			self._prune()
+			path = self._cache_path()
+			temp_path = f"{path}.tmp"
+			try:
+				with gzip.open(temp_path, "wt", encoding="utf-8") as file:
+					json.dump({"entries": self._entries}, file, separators=(",", ":"), default=str)
+				os.replace(temp_path, path)
+				self._dirty = False
+			except OSError as error:
+				print(f"Warning: Could not save Canvas response cache: {error}")
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self._loaded = True
+			self._dirty = False
+			try:
+				os.remove(self._cache_path())
+			except OSError:
+				pass
+
+
+CANVAS_RESPONSE_CACHE = CanvasResponseCache()
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def invalidate_canvas_cache() -> None:
+	"""Drop every cached Canvas response, in memory and on disk, and the session course catalog."""
+	CANVAS_RESPONSE_CACHE.clear()
+	CANVAS_COURSE_CATALOG.invalidate()
+
+
+def _canvas_endpoint_class(url: str) -> str:
+	path = urllib.parse.urlparse(url).path.rstrip("/")
+	if re.search(r"/api/v1/courses$", path):
+		return "courses"
+	if re.search(r"/api/v1/courses/\d+/assignments$", path):
+		return "assignments"
+	if re.search(r"/api/v1/calendar_events$", path):
+		return "calendar_events"
+	return ""
 
-		link_header = response.headers.get("link") or response.headers.get("Link")
+
+def _response_header(response, name: str) -> str | None:
+	headers = getattr(response, "headers", None) or {}
+	return headers.get(name.lower()) or headers.get(name)
+
+
+def _response_header_float(response, name: str) -> float | None:
+	try:
+		return float(_response_header(response, name))
+	except (TypeError, ValueError):
+		return None
+
+
+class CanvasRateLimiter:
+	"""Paces Canvas requests from every thread against Canvas's request-cost bucket.
+
+	Canvas charges each request against a per-user bucket (X-Rate-Limit-Remaining after
+	X-Request-Cost) plus a flat pre-flight charge while it runs, and answers 403 "Rate Limit
+	Exceeded" once it is empty. A request waits while the estimated bucket, less the
+	requests still in flight, is below CANVAS_RATE_LIMIT_FLOOR. clock defaults to
+	time.monotonic and wait to waiting on the limiter's condition; tests pass their own.
+	"""
+
+	def __init__(self, clock=time.monotonic, wait=None):
+		self._clock = clock
+		self._condition = threading.Condition()
+		self._wait = wait or self._condition.wait
+		self._remaining: float | None = None
+		self._updated_at = 0.0
+		self._average_cost = 1.0
+		self._in_flight = 0
+		self._stats = {"requests": 0, "pacedWaits": 0, "pacedSeconds": 0.0, "rateLimited": 0}
+
+	def _estimated_remaining(self, now: float) -> float | None:
+		if self._remaining is None:
+			return None
+		refilled = self._remaining + (now - self._updated_at) * CANVAS_RATE_LIMIT_REFILL_PER_SECOND
+		return refilled - self._in_flight * (self._average_cost + CANVAS_RATE_LIMIT_PREFLIGHT_COST)
+
+	def acquire(self) -> None:
+		with self._condition:
+			started = self._clock()
+			while True:
+				estimated = self._estimated_remaining(self._clock())
+				if estimated is None or estimated >= CANVAS_RATE_LIMIT_FLOOR:
+					break
+				delay = (CANVAS_RATE_LIMIT_FLOOR - estimated) / CANVAS_RATE_LIMIT_REFILL_PER_SECOND
+				self._wait(min(delay, 5.0))
+
+			waited = self._clock() - started
+			if waited > 0.001:
+				self._stats["pacedWaits"] += 1
+				self._stats["pacedSeconds"] += waited
+			self._stats["requests"] += 1
+			self._in_flight += 1
+
+	def release(self, response) -> None:
+		with self._condition:
+			self._in_flight = max(0, self._in_flight - 1)
+			remaining = _response_header_float(response, "X-Rate-Limit-Remaining")
+			if remaining is not None:
+				self._remaining = remaining
+				self._updated_at = self._clock()
+			cost = _response_header_float(response, "X-Request-Cost")
+			if cost is not None:
+				self._average_cost = 0.8 * self._average_cost + 0.2 * cost
+			self._condition.notify_all()
+
+	def throttled(self, attempt: int) -> float:
+		"""Record a rate-limited response and return how long to back off before retrying."""
+		with self._condition:
+			self._remaining = 0.0
+			self._updated_at = self._clock()
+			self._stats["rateLimited"] += 1
+		return min(CANVAS_RATE_LIMIT_BACKOFF_SECONDS * (2 ** attempt), 30.0)
+
+	def snapshot(self, since: dict | None = None) -> dict:
+		"""Return the counters, or how much they grew since an earlier snapshot."""
+		with self._condition:
+			stats = {key: value - (since or {}).get(key, 0) for key, value in self._stats.items()}
+			return {
+				**stats,
+				"pacedSeconds": round(stats["pacedSeconds"], 3),
+				"remaining": self._remaining,
+				"averageCost": round(self._average_cost, 3),
+			}
+
+
+CANVAS_RATE_LIMITER = CanvasRateLimiter()
+
+
+def _is_rate_limited(response) -> bool:
+	status = int(getattr(response, "status", 0) or 0)
+	if status == 429:
+		return True
+	if status != 403:
+		return False
+
+	remaining = _response_header_float(response, "X-Rate-Limit-Remaining")
+	if remaining is not None and remaining <= 0:
+		return True
+	try:
+		return "rate limit exceeded" in str(response.text()).lower()
+	except Exception:
+		return False
+
+
+def _canvas_request(api_context, method: str, url: str, **kwargs):
+	"""Send a Canvas request through CANVAS_RATE_LIMITER and HOST_RESILIENCE.
+
+	Throttled responses are retried after backing off. GETs are also retried with jittered
+	backoff on connection errors and 5xx responses.
+	"""
+	host = urllib.parse.urlsplit(url).netloc
+	idempotent = method == "get"
+	throttled_attempts = 0
+	attempt = 0
+
+	while True:
+		HOST_RESILIENCE.before_call(host)
+		CANVAS_RATE_LIMITER.acquire()
+		response = None
+		failure: Exception | None = None
+		try:
+			response = getattr(api_context, method)(url, **kwargs)
+		except Exception as error:
+			failure = error
+		finally:
+			CANVAS_RATE_LIMITER.release(response)
+
+		auth_tracker = getattr(api_context, "auth", None)
+		if failure is None and isinstance(auth_tracker, CanvasAuthTracker) and not _is_rate_limited(response):
+			auth_tracker.observe(url, response)
+
+		if failure is None and _is_rate_limited(response):
+			HOST_RESILIENCE.record_success(host)
+			if throttled_attempts >= CANVAS_RATE_LIMIT_MAX_RETRIES:
+				return response
+			delay = CANVAS_RATE_LIMITER.throttled(throttled_attempts)
+			throttled_attempts += 1
+			print(f"Canvas rate limit reached. Retrying in {delay:.1f}s...")
+			time.sleep(delay)
+			continue
+
+		if failure is None and int(getattr(response, "status", 0) or 0) not in RETRYABLE_STATUS_CODES:
+			HOST_RESILIENCE.record_success(host)
+			return response
+
+		HOST_RESILIENCE.record_failure(host)
+		if not idempotent or attempt >= RETRY_MAX_ATTEMPTS - 1:
+			if failure is not None:
+				raise RuntimeError(f"Canvas request failed: {failure}") from failure
+			return response
+
+		delay = HOST_RESILIENCE.backoff(attempt)
+		reason = failure if failure is not None else f"{response.status} {response.status_text}"
+		print(f"Canvas request failed ({reason}). Retrying in {delay:.1f}s...")
+		time.sleep(delay)
+		attempt += 1
+
+
+def _project_fields(item, fields: list[str] | None):
+	"""Keep only the listed keys of a Canvas object; "parent.child" keeps one nested key."""
+	if not fields or not isinstance(item, dict):
+		return item
+
+	projected: dict = {}
+	for field in fields:
+		key, _, sub_key = field.partition(".")
+		if key not in item:
+			continue
+		if not sub_key:
+			projected[key] = item[key]
+		elif isinstance(item[key], dict):
+			nested = projected.setdefault(key, {})
+			if sub_key in item[key]:
+				nested[sub_key] = item[key][sub_key]
+	return projected
+
+
+def _decode_page_items(body: bytes | str, fields: list[str] | None) -> list | None:
+	"""Decode a JSON array page element by element, projecting each element as it is parsed.
+
+	Returns None when the payload is not an array.
+	"""
+	text = body.decode("utf-8") if isinstance(body, (bytes, bytearray)) else str(body)
+	index = _JSON_WHITESPACE.match(text, 0).end()
+	if index >= len(text) or text[index] != "[":
+		json.loads(text)
+		return None
+
+	items: list = []
+	index = _JSON_WHITESPACE.match(text, index + 1).end()
+	if index < len(text) and text[index] == "]":
+		return items
+
+	while True:
+		item, index = _JSON_DECODER.raw_decode(text, index)
+		items.append(_project_fields(item, fields))
+		index = _JSON_WHITESPACE.match(text, index).end()
+		if index < len(text) and text[index] == ",":
+			index = _JSON_WHITESPACE.match(text, index + 1).end()
+			continue
+		if index < len(text) and text[index] == "]":
+			return items
+		raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+
+
+def _fetch_page(
+	api_context,
+	url: str,
+	force_refresh: bool,
+	stats: dict,
+	field_list: list[str] | None,
+) -> tuple[list | None, str | None]:
+	"""Fetch one Canvas list page through the response cache. Returns (items, Link header)."""
+	for key in ("pages", "bytes", "cachedPages"):
+		stats.setdefault(key, 0)
+
+	cached = CANVAS_RESPONSE_CACHE.get(url)
+	if cached is not None and cached.get("fields") != field_list:
+		cached = None
+
+	if not force_refresh and CANVAS_RESPONSE_CACHE.is_fresh(url, cached):
+		stats["cachedPages"] += 1
+		return cached["items"], cached["link"]
+
+	conditional_headers = CANVAS_RESPONSE_CACHE.conditional_headers(cached)
+	if conditional_headers:
+		response = _canvas_request(api_context, "get", url, headers=conditional_headers)
+	else:
+		response = _canvas_request(api_context, "get", url)
+
+	if cached is not None and int(getattr(response, "status", 0) or 0) == 304:
+		# Unchanged since the last fetch: replay the stored page and its Link header.
+		CANVAS_RESPONSE_CACHE.touch(url)
+		stats["cachedPages"] += 1
+		return cached["items"], cached["link"]
+
+	if not response.ok:
+		raise RuntimeError(f"Canvas API request failed: {response.status} {response.status_text}")
+
+	body = response.body()
+	stats["pages"] += 1
+	stats["bytes"] += len(body)
+	items = _decode_page_items(body, field_list)
+	del body
+	link_header = _response_header(response, "Link")
+	if items is not None:
+		CANVAS_RESPONSE_CACHE.store(
+			url,
+			_response_header(response, "ETag"),
+			_response_header(response, "Last-Modified"),
+			items,
+			link_header,
+			field_list,
+		)
+	return items, link_header
+
+
+def _iter_numbered_pages(
+	api_context,
+	page_urls: list[str],
+	force_refresh: bool,
+	stats: dict,
+	field_list: list[str] | None,
+):
+	"""Fetch known page URLs concurrently and yield (items, Link header) in page order."""
+
+	def _fetch(page_url: str) -> tuple[list | None, str | None, dict]:
+		page_stats: dict = {}
+		items, link_header = _fetch_page(api_context, page_url, force_refresh, page_stats, field_list)
+		return items, link_header, page_stats
+
+	with ThreadPoolExecutor(max_workers=min(CANVAS_MAX_IN_FLIGHT, len(page_urls))) as executor:
+		for items, link_header, page_stats in executor.map(_fetch, page_urls):
+			for key, value in page_stats.items():
+				stats[key] = stats.get(key, 0) + value
+			yield items, link_header
+
+
+def _iter_pages(
+	api_context,
+	url: str,
+	force_refresh: bool = False,
+	stats: dict | None = None,
+	fields: list[str] | tuple[str, ...] | None = None,
+):
+	"""Yield the items of every page of a Canvas list endpoint, one page at a time.
+
+	With fields, each element is reduced to those keys as soon as it is decoded, so large
+	values the sync never reads (HTML descriptions, rubrics) are not kept or cached. When
+	stats is given, it accumulates downloaded pages/bytes and pages served from cache.
+
+	If the transport is thread-safe and the first page links numbered pages through
+	rel="last", the remaining pages are fetched concurrently; bookmark cursors are followed
+	one page at a time.
+	"""
+	field_list = list(fields) if fields else None
+	if stats is None:
+		stats = {}
+
+	items, link_header = _fetch_page(api_context, url, force_refresh, stats, field_list)
+	if isinstance(items, list):
+		yield from items
+
+	page_urls = _numbered_page_urls(link_header) if getattr(api_context, "thread_safe", False) else None
+	if page_urls and len(page_urls) > 1:
+		for items, link_header in _iter_numbered_pages(api_context, page_urls, force_refresh, stats, field_list):
+			if isinstance(items, list):
+				yield from items
 		next_url = _extract_next_link(link_header)
+		if next_url in page_urls:
+			next_url = None
+	else:
+		next_url = _extract_next_link(link_header)
+
+	while next_url:
+		items, link_header = _fetch_page(api_context, next_url, force_refresh, stats, field_list)
+		if isinstance(items, list):
+			yield from items
+		next_url = _extract_next_link(link_header)
+
 
-	return all_items
+def _fetch_all_pages(
+	api_context,
+	url: str,
+	force_refresh: bool = False,
+	stats: dict | None = None,
+	fields: list[str] | tuple[str, ...] | None = None,
+) -> list[dict]:
+	return list(_iter_pages(api_context, url, force_refresh, stats, fields))
 
 
 def _is_canvas_authenticated(api_context) -> bool:
@@ -718,9 +1831,17 @@ def _is_canvas_authenticated(api_context) -> bool:
 
 
 def get_canvas_auth_status(api_context) -> str:
-	"""Return Canvas auth status: authenticated, unauthenticated, or unreachable."""
+	"""Return Canvas auth status: authenticated, unauthenticated, or unreachable.
+
+	Clients with a CanvasAuthTracker skip the /users/self probe while a recent response
+	already proved the session.
+	"""
+	auth_tracker = getattr(api_context, "auth", None)
+	if isinstance(auth_tracker, CanvasAuthTracker) and auth_tracker.is_authenticated():
+		return "authenticated"
+
 	try:
-		response = api_context.get(f"{CANVAS_BASE_URL}/api/v1/users/self")
+		response = _canvas_request(api_context, "get", f"{CANVAS_BASE_URL}/api/v1/users/self")
 	except Exception:
 		return "unreachable"
 
@@ -793,16 +1914,47 @@ def _is_current_canvas_course(course: dict) -> bool:
 	return True
 
 
-def _normalize_name(value: str) -> str:
-	return re.sub(r"\s+", " ", value).strip().casefold()
+class CanvasCourseCatalog:
+	"""Current Canvas courses, listed and filtered once and shared for the rest of the session."""
 
+	def __init__(self):
+		self._current_courses: list[dict] | None = None
+		self._lock = threading.Lock()
 
-def _compact_name(value: str) -> str:
-	return re.sub(r"\s+", "", value).casefold()
+	def current_courses(self, api_context, force_refresh: bool = False) -> list[dict]:
+		with self._lock:
+			if self._current_courses is not None and not force_refresh:
+				print(f"Using {len(self._current_courses)} current/active Canvas courses from this session.")
+				return list(self._current_courses)
 
+			print("Fetching Canvas courses...")
+			courses = _fetch_all_pages(api_context, CANVAS_COURSES_URL, force_refresh)
+			CANVAS_RESPONSE_CACHE.save()
+			self._current_courses = [
+				course for course in courses if isinstance(course, dict) and _is_current_canvas_course(course)
+			]
+			print(f"Found {len(courses)} Canvas course entries total.")
+			print(f"Retained {len(self._current_courses)} current/active courses after filtering.")
+			return list(self._current_courses)
 
-def _alnum_space(value: str) -> str:
-	return re.sub(r"[^a-z0-9]+", " ", value.casefold()).strip()
+	def invalidate(self) -> None:
+		with self._lock:
+			self._current_courses = None
+
+
+CANVAS_COURSE_CATALOG = CanvasCourseCatalog()
+
+
+def _normalize_name(value: str) -> str:
+	return re.sub(r"\s+", " ", value).strip().casefold()
+
+
+def _compact_name(value: str) -> str:
+	return re.sub(r"\s+", "", value).casefold()
+
+
+def _alnum_space(value: str) -> str:
+	return re.sub(r"[^a-z0-9]+", " ", value.casefold()).strip()
 
 
 def _alnum_compact(value: str) -> str:
@@ -874,52 +2026,29 @@ def _match_canvas_course_to_sheet_tab(canvas_course_name: str, patterns: list[di
 	return best_tab if best_score >= 3 else None
 
 
-def _write_sheet_classes_debug(raw_response: str, tab_names: list[str], filtered_tabs: list[str], allowed: set[str]) -> None:
-	os.makedirs(OUTPUT_DIR, exist_ok=True)
-	with open(SHEET_CLASSES_DEBUG_FILE, "w", encoding="utf-8") as file:
-		file.write("Sheet class debug output\n")
-		file.write("========================\n\n")
-		file.write("Raw API response:\n")
-		file.write(raw_response)
-		file.write("\n\n")
-
-		file.write("Tabs parsed from response:\n")
-		if tab_names:
-			for name in tab_names:
-				file.write(f"- {name}\n")
-		else:
-			file.write("(none)\n")
-		file.write("\n")
-
-		file.write("Tabs after excluding dashboard/class[template]:\n")
-		if filtered_tabs:
-			for name in filtered_tabs:
-				file.write(f"- {name}\n")
-		else:
-			file.write("(none)\n")
-		file.write("\n")
-
-		file.write("Normalized names used for matching:\n")
-		if allowed:
-			for name in sorted(allowed):
-				file.write(f"- {name}\n")
-		else:
-			file.write("(none)\n")
+def _render_sheet_classes_debug(parsed: dict, tab_names: list[str], filtered_tabs: list[str], allowed: set[str]) -> str:
+	lines = ["Sheet class debug output", "========================", "", "Raw API response:", _compact_json(parsed)]
+	sections = (
+		("Tabs parsed from response:", tab_names),
+		("Tabs after excluding dashboard/class[template]:", filtered_tabs),
+		("Normalized names used for matching:", sorted(allowed)),
+	)
+	for heading, names in sections:
+		lines.extend(["", heading])
+		lines.extend([f"- {name}" for name in names] or ["(none)"])
+	return "\n".join(lines) + "\n"
 
 
 def fetch_allowed_sheet_classes() -> list[str]:
 	service = _google_sheets_service()
 	spreadsheet_id = _require_spreadsheet_id()
 
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="properties.title,sheets.properties.title",
-	).execute()
-	raw = json.dumps(parsed, ensure_ascii=False, indent=2)
+	# Each operation starts by loading tabs, so pick up tabs edited outside the app here.
+	unchanged = SPREADSHEET_CHANGES.validate(spreadsheet_id) is True
+	parsed = SPREADSHEET_METADATA.get(service, spreadsheet_id, refresh=not unchanged)
 	tab_names = [
-		str((sheet.get("properties") or {}).get("title") or "").strip()
-		for sheet in parsed.get("sheets", [])
-		if isinstance(sheet, dict)
+		str(props.get("title") or "").strip()
+		for props in SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id)
 	]
 	tab_names = [name for name in tab_names if name]
 	excluded_compact = {_compact_name(name) for name in EXCLUDED_TAB_NAMES}
@@ -930,8 +2059,11 @@ def fetch_allowed_sheet_classes() -> list[str]:
 	]
 
 	allowed = {_normalize_name(tab_name) for tab_name in filtered_tabs if tab_name.strip()}
-	_write_sheet_classes_debug(raw, tab_names, filtered_tabs, allowed)
-	print(f"Wrote sheet class debug output to {SHEET_CLASSES_DEBUG_FILE}")
+	if DEBUG_ARTIFACTS.submit(
+		SHEET_CLASSES_DEBUG_FILE,
+		lambda: _render_sheet_classes_debug(parsed, tab_names, filtered_tabs, allowed),
+	):
+		print(f"Writing sheet class debug output to {SHEET_CLASSES_DEBUG_FILE}")
 	if not filtered_tabs:
 		raise RuntimeError(
 			"No class tabs were returned from Google Sheet API. "
@@ -947,28 +2079,358 @@ def infer_sheet_display_name(sheet_url: str) -> str:
 	if not spreadsheet_id:
 		raise RuntimeError("Invalid Google Sheet URL.")
 	service = _google_sheets_service()
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="properties.title",
-	).execute()
+	parsed = SPREADSHEET_METADATA.get(service, spreadsheet_id)
 	return str((parsed.get("properties") or {}).get("title") or "").strip() or f"Sheet {spreadsheet_id[:8]}"
 
 
-def fetch_assignments_from_canvas_context(
+def _context_storage_state(context) -> dict | None:
+	"""Return the Canvas storage_state behind a browser context or request shim, if available."""
+	storage_state = getattr(context, "storage_state", None)
+	if callable(storage_state):
+		try:
+			storage_state = storage_state()
+		except Exception:
+			return None
+	return storage_state if isinstance(storage_state, dict) else None
+
+
+def _assignment_list_query(resolve_overrides: bool) -> str:
+	"""Build the per-course assignment list query for a sync mode.
+
+	Future-only syncs still fetch every assignment: Canvas's bucket=future cuts off at the
+	current time, while the local filter keeps anything due later today. include=all_dates
+	adds per-section override arrays to every assignment, so it is only requested when
+	override resolution is on.
+	"""
+	params = [("per_page", "100"), ("order_by", "due_at")]
+	if resolve_overrides:
+		params.append(("include", "all_dates"))
+	return urllib.parse.urlencode(params)
+
+
+def _resolve_override_due_at(assignment: dict) -> str | None:
+	"""Pick a due date from all_dates when Canvas left the top-level due_at empty."""
+	all_dates = assignment.get("all_dates")
+	if not isinstance(all_dates, list):
+		return None
+	dated = [entry for entry in all_dates if isinstance(entry, dict) and entry.get("due_at")]
+	for entry in dated:
+		if entry.get("base"):
+			return entry["due_at"]
+	if len(dated) == 1:
+		return dated[0]["due_at"]
+	return None
+
+
+def _fetch_course_assignments(
+	api_context,
+	course_id: int,
+	matched_tab: str,
+	query: str,
+	force_refresh: bool = False,
+	stats: dict | None = None,
+	fields: tuple[str, ...] = ASSIGNMENT_FIELDS,
+) -> tuple[int, str, list[dict] | None, str]:
+	"""Fetch one course's assignments. Returns (course_id, tab, assignments or None, error)."""
+	course_assignments_url = f"{CANVAS_BASE_URL}/api/v1/courses/{course_id}/assignments?{query}"
+	try:
+		assignments = _fetch_all_pages(api_context, course_assignments_url, force_refresh, stats, fields)
+		return course_id, matched_tab, assignments, ""
+	except RuntimeError as error:
+		return course_id, matched_tab, None, str(error)
+
+
+def _iter_matched_course_assignments(
+	context,
+	matched_courses: list[tuple[int, str]],
+	query: str,
+	max_in_flight: int = CANVAS_MAX_IN_FLIGHT,
+	force_refresh: bool = False,
+	course_stats: dict[int, dict] | None = None,
+	fields: tuple[str, ...] = ASSIGNMENT_FIELDS,
+):
+	"""Yield assignment results for matched courses in matched_courses order, as each is ready.
+
+	A thread-safe transport (CanvasHttpClient) is shared by the workers. Playwright objects
+	are bound to the thread that created them, so with Playwright each worker opens its
+	own request context from the session storage_state. Courses a worker could not finish
+	are retried sequentially on the caller's context. A result is dropped from the buffer
+	once yielded, so only courses fetched ahead of the consumer are held in memory.
+	"""
+	results: list[tuple[int, str, list[dict] | None, str] | None] = [None] * len(matched_courses)
+	finished = [threading.Event() for _ in matched_courses]
+	if course_stats is None:
+		course_stats = {}
+	for course_id, _ in matched_courses:
+		course_stats.setdefault(course_id, {})
+	worker_count = min(max(1, int(max_in_flight or 1)), len(matched_courses))
+	shared_request = context.request if getattr(context.request, "thread_safe", False) else None
+	storage_state = _context_storage_state(context) if worker_count > 1 and shared_request is None else None
+	workers: list[threading.Thread] = []
+
+	if worker_count > 1 and (shared_request is not None or storage_state is not None):
+		jobs: queue.Queue[tuple[int, int, str]] = queue.Queue()
+		for index, (course_id, matched_tab) in enumerate(matched_courses):
+			jobs.put((index, course_id, matched_tab))
+
+		def _drain(api_context) -> None:
+			while True:
+				try:
+					index, course_id, matched_tab = jobs.get_nowait()
+				except queue.Empty:
+					return
+				results[index] = _fetch_course_assignments(
+					api_context,
+					course_id,
+					matched_tab,
+					query,
+					force_refresh,
+					course_stats[course_id],
+					fields,
+				)
+				finished[index].set()
+
+		def _worker() -> None:
+			try:
+				if shared_request is not None:
+					_drain(shared_request)
+					return
+				with sync_playwright() as playwright:
+					api_context = playwright.request.new_context(storage_state=storage_state)
+					try:
+						_drain(api_context)
+					finally:
+						api_context.dispose()
+			except Exception:
+				# Unfinished courses fall back to the sequential pass below.
+				return
+
+		print(f"Fetching assignments with up to {worker_count} courses in flight...")
+		workers = [threading.Thread(target=_worker, daemon=True) for _ in range(worker_count)]
+		for worker in workers:
+			worker.start()
+
+	for index, (course_id, matched_tab) in enumerate(matched_courses):
+		while workers and not finished[index].wait(0.05):
+			if not any(worker.is_alive() for worker in workers):
+				break
+		result = results[index]
+		results[index] = None
+		if result is None:
+			result = _fetch_course_assignments(
+				context.request,
+				course_id,
+				matched_tab,
+				query,
+				force_refresh,
+				course_stats[course_id],
+				fields,
+			)
+		yield result
+
+
+def _canvas_csrf_token(storage_state: dict | None) -> str:
+	"""Return the session's CSRF token, which Canvas requires on cookie-authenticated POSTs."""
+	for cookie in (storage_state or {}).get("cookies", []):
+		if isinstance(cookie, dict) and cookie.get("name") == "_csrf_token":
+			return urllib.parse.unquote(str(cookie.get("value") or ""))
+	return ""
+
+
+def _graphql_assignments_query(cursors: dict[int, str | None]) -> str:
+	course_blocks: list[str] = []
+	for course_id, cursor in cursors.items():
+		after = f", after: {json.dumps(cursor)}" if cursor else ""
+		course_blocks.append(
+			f'c{course_id}: course(id: "{course_id}") {{ '
+			f"assignmentsConnection(first: {CANVAS_GRAPHQL_PAGE_SIZE}{after}) {{ "
+			"nodes { _id name dueAt htmlUrl } "
+			"pageInfo { hasNextPage endCursor } "
+			"} }"
+		)
+	return "query AssignmentTrackerAssignments { " + " ".join(course_blocks) + " }"
+
+
+def _fetch_assignments_via_graphql(context, course_ids: list[int]) -> dict[int, list[dict]]:
+	"""Fetch assignments for several courses per /api/graphql request.
+
+	Every course is aliased into one query; later pages re-query only the courses whose
+	connection still has a next page. Nodes are mapped onto the REST field names the sync
+	reads. Raises RuntimeError on any GraphQL error so the caller can fall back to REST.
+	"""
+	headers = {"Content-Type": "application/json", "Accept": "application/json"}
+	csrf_token = _canvas_csrf_token(_context_storage_state(context))
+	if csrf_token:
+		headers["X-CSRF-Token"] = csrf_token
+
+	assignments_by_course_id: dict[int, list[dict]] = {course_id: [] for course_id in course_ids}
+	cursors: dict[int, str | None] = {course_id: None for course_id in course_ids}
+
+	while cursors:
+		response = _canvas_request(
+			context.request,
+			"post",
+			CANVAS_GRAPHQL_URL,
+			data=json.dumps({"query": _graphql_assignments_query(cursors)}),
+			headers=headers,
+		)
+		if not response.ok:
+			raise RuntimeError(f"Canvas GraphQL request failed: {response.status} {response.status_text}")
+
+		payload = response.json()
+		if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+			raise RuntimeError("Canvas GraphQL returned no data.")
+		if payload.get("errors"):
+			raise RuntimeError(f"Canvas GraphQL returned errors: {payload['errors']}")
+
+		next_cursors: dict[int, str | None] = {}
+		for course_id in cursors:
+			course = payload["data"].get(f"c{course_id}")
+			if not isinstance(course, dict):
+				raise RuntimeError(f"Canvas GraphQL returned no course data for {course_id}.")
+
+			connection = course.get("assignmentsConnection") or {}
+			for node in connection.get("nodes") or []:
+				if not isinstance(node, dict):
+					continue
+				assignments_by_course_id[course_id].append(
+					{
+						"id": _parse_course_id(node.get("_id")),
+						"name": node.get("name"),
+						"due_at": node.get("dueAt"),
+						"html_url": node.get("htmlUrl"),
+					}
+				)
+
+			page_info = connection.get("pageInfo") or {}
+			if page_info.get("hasNextPage") and page_info.get("endCursor"):
+				next_cursors[course_id] = page_info["endCursor"]
+
+		cursors = next_cursors
+
+	return assignments_by_course_id
+
+
+def _fetch_future_assignments_via_calendar(
+	api_context,
+	course_ids: list[int],
+	force_refresh: bool = False,
+	stats: dict | None = None,
+) -> dict[int, list[dict]]:
+	"""Fetch assignments due this month onward from /calendar_events, several courses per request.
+
+	Only the date window is downloaded instead of each course's full history. The window
+	starts on the first of the month, at least a day back, so request URLs (and their cache
+	entries) stay the same all month. It runs to CANVAS_CALENDAR_END_DATE so no future
+	assignment is cut off. Earlier dates are dropped by the usual local filter. Assignments
+	shown once per section override are de-duplicated by assignment id.
+	"""
+	start_date = (datetime.now().date() - timedelta(days=1)).replace(day=1).isoformat()
+	end_date = CANVAS_CALENDAR_END_DATE
+
+	assignments_by_course_id: dict[int, list[dict]] = {course_id: [] for course_id in course_ids}
+	seen: set[tuple[int, object]] = set()
+
+	for offset in range(0, len(course_ids), CANVAS_CALENDAR_CONTEXTS_PER_REQUEST):
+		batch = course_ids[offset:offset + CANVAS_CALENDAR_CONTEXTS_PER_REQUEST]
+		query = urllib.parse.urlencode(
+			[
+				("type", "assignment"),
+				("start_date", start_date),
+				("end_date", end_date),
+				("per_page", "100"),
+			]
+			+ [("context_codes[]", f"course_{course_id}") for course_id in batch]
+		)
+		events = _fetch_all_pages(
+			api_context,
+			f"{CANVAS_BASE_URL}/api/v1/calendar_events?{query}",
+			force_refresh,
+			stats,
+			CALENDAR_EVENT_FIELDS,
+		)
+
+		for event in events:
+			if not isinstance(event, dict):
+				continue
+			context_code = str(event.get("context_code") or "")
+			course_id = _parse_course_id(context_code.removeprefix("course_"))
+			if course_id not in assignments_by_course_id:
+				continue
+
+			assignment = event.get("assignment")
+			if not isinstance(assignment, dict):
+				assignment = {
+					"id": event.get("id"),
+					"name": event.get("title"),
+					"due_at": event.get("end_at") or event.get("start_at"),
+					"html_url": event.get("html_url"),
+				}
+
+			key = (course_id, assignment.get("id"))
+			if key in seen:
+				continue
+			seen.add(key)
+			assignments_by_course_id[course_id].append(assignment)
+
+	return assignments_by_course_id
+
+
+def _assignment_records(
+	assignments: list[dict],
+	class_name: str,
+	include_past_assignments: bool,
+	today_local,
+) -> tuple[list[dict], int, int]:
+	"""Turn one course's assignments into sheet records. Returns (records, skipped no due, skipped past)."""
+	records: list[dict] = []
+	skipped_no_due_date = 0
+	skipped_past_date = 0
+
+	for assignment in assignments:
+		due_at = assignment.get("due_at")
+		if not due_at:
+			skipped_no_due_date += 1
+			continue
+
+		normalized = due_at.replace("Z", "+00:00")
+		due_dt = datetime.fromisoformat(normalized)
+		due_local_date = due_dt.astimezone().date()
+		if not include_past_assignments and due_local_date < today_local:
+			skipped_past_date += 1
+			continue
+
+		records.append(
+			{
+				"assignment name": assignment.get("name") or "",
+				"due-date": due_local_date.strftime("%m/%d/%Y"),
+				"Class": class_name,
+			}
+		)
+
+	return records, skipped_no_due_date, skipped_past_date
+
+
+def iter_assignments_by_class(
 	context,
 	sheet_patterns: list[dict],
 	include_past_assignments: bool = False,
-) -> dict[str, list[dict]]:
-	courses_url = (
-		f"{CANVAS_BASE_URL}/api/v1/courses"
-		"?per_page=100&enrollment_state=active&state[]=available"
-	)
-
-	print("Fetching courses...")
-	courses = _fetch_all_pages(context.request, courses_url)
-	current_courses = [course for course in courses if isinstance(course, dict) and _is_current_canvas_course(course)]
-	print(f"Found {len(courses)} Canvas course entries total.")
-	print(f"Retained {len(current_courses)} current/active courses after filtering.")
+	max_in_flight: int = CANVAS_MAX_IN_FLIGHT,
+	force_refresh: bool = False,
+	engine: str = CANVAS_FETCH_ENGINE,
+	resolve_overrides: bool = False,
+	fetch_report: dict | None = None,
+):
+	"""Yield (sheet tab, sorted records) for courses matching the sheet tabs, one tab at a time.
+
+	A tab is yielded as soon as every course mapped to it has been fetched, so callers can
+	start writing before the remaining courses arrive. Only the assignment fields the sync
+	uses are kept. When fetch_report is given it is filled with the engine and query used
+	and the per-course page/byte counts once the generator is exhausted.
+	"""
+	rate_limit_start = CANVAS_RATE_LIMITER.snapshot()
+	resilience_start = HOST_RESILIENCE.snapshot()
+	current_courses = CANVAS_COURSE_CATALOG.current_courses(context.request, force_refresh)
 
 	matched_courses: list[tuple[int, str]] = []
 	for course in current_courses:
@@ -983,19 +2445,89 @@ def fetch_assignments_from_canvas_context(
 
 	print(f"Matched {len(matched_courses)} Canvas courses to sheet tabs. Fetching assignments only for matched courses...")
 
-	assignments_by_course_id: dict[int, list[dict]] = {}
-	course_id_to_sheet_tab: dict[int, str] = {}
-	for course_id, matched_tab in matched_courses:
-		course_assignments_url = (
-			f"{CANVAS_BASE_URL}/api/v1/courses/{course_id}/assignments"
-			"?per_page=100&order_by=due_at&include=all_dates"
-		)
+	query = _assignment_list_query(resolve_overrides)
+	fields = ASSIGNMENT_FIELDS + (("all_dates",) if resolve_overrides else ())
+	fetch_engine = "rest"
+	course_stats: dict[int, dict] = {}
+	calendar_stats: dict = {}
+
+	course_results = None
+	if engine == "graphql" and matched_courses:
+		try:
+			print("Fetching assignments for all matched courses through Canvas GraphQL...")
+			graphql_assignments = _fetch_assignments_via_graphql(
+				context,
+				[course_id for course_id, _ in matched_courses],
+			)
+			course_results = (
+				(course_id, matched_tab, graphql_assignments.pop(course_id, []), "")
+				for course_id, matched_tab in matched_courses
+			)
+			fetch_engine = "graphql"
+		except Exception as error:
+			print(f"Canvas GraphQL unavailable ({error}). Falling back to REST...")
+
+	if course_results is None and not include_past_assignments and matched_courses:
 		try:
-			all_assignments = _fetch_all_pages(context.request, course_assignments_url)
-			assignments_by_course_id[course_id] = all_assignments
-			course_id_to_sheet_tab[course_id] = matched_tab
+			print("Fetching future assignments from the Canvas calendar...")
+			calendar_assignments = _fetch_future_assignments_via_calendar(
+				context.request,
+				[course_id for course_id, _ in matched_courses],
+				force_refresh=force_refresh,
+				stats=calendar_stats,
+			)
+			course_results = (
+				(course_id, matched_tab, calendar_assignments.pop(course_id, []), "")
+				for course_id, matched_tab in matched_courses
+			)
+			fetch_engine = "calendar"
+		except RuntimeError as error:
+			print(f"Canvas calendar fetch failed ({error}). Falling back to per-course assignment lists...")
+
+	if course_results is None:
+		print(f"Assignment list query: {query}")
+		course_results = _iter_matched_course_assignments(
+			context,
+			matched_courses,
+			query,
+			max_in_flight=max_in_flight,
+			force_refresh=force_refresh,
+			course_stats=course_stats,
+			fields=fields,
+		)
+
+	today_local = datetime.now().date()
+	last_index_by_tab = {matched_tab: index for index, (_, matched_tab) in enumerate(matched_courses)}
+	pending_tabs = list(dict.fromkeys(matched_tab for _, matched_tab in matched_courses))
+	pending_records: dict[str, list[dict]] = {}
+	report_courses: list[dict] = []
+	debug_data: dict[str, list[dict]] | None = {} if DEBUG_ARTIFACTS.enabled("full") else None
+	fetched_courses = 0
+
+	for index, (course_id, matched_tab, all_assignments, error) in enumerate(course_results):
+		report_courses.append(
+			{
+				"courseId": course_id,
+				"sheetTab": matched_tab,
+				"assignments": None if all_assignments is None else len(all_assignments),
+				**course_stats.get(course_id, {}),
+				"error": error,
+			}
+		)
+		if all_assignments is None:
+			print(f"Skipping course {course_id}: {error}")
+		else:
+			if resolve_overrides:
+				all_assignments = [
+					{**assignment, "due_at": _resolve_override_due_at(assignment)}
+					if not assignment.get("due_at")
+					else assignment
+					for assignment in all_assignments
+				]
+
+			fetched_courses += 1
 			print(f"  Course {course_id} ({matched_tab}): fetched {len(all_assignments)} assignments")
-			
+
 			# Debug: show assignments without due_at
 			missing_due_date = [a for a in all_assignments if not a.get("due_at")]
 			if missing_due_date:
@@ -1004,126 +2536,343 @@ def fetch_assignments_from_canvas_context(
 					print(f"      - {a.get('name', 'Unknown')}")
 				if len(missing_due_date) > 5:
 					print(f"      ... and {len(missing_due_date) - 5} more")
-		except RuntimeError as error:
-			print(f"Skipping course {course_id}: {error}")
-			continue
 
-	print(f"Finished fetching assignments for {len(assignments_by_course_id)} courses.")
+			if debug_data is not None:
+				debug_data.setdefault(matched_tab, []).extend(
+					{
+						"name": a.get("name"),
+						"due_at": a.get("due_at"),
+						"id": a.get("id"),
+						"html_url": a.get("html_url"),
+					}
+					for a in all_assignments
+				)
 
-	today_local = datetime.now().date()
-	course_names_by_id: dict[int, str] = {}
-	for course in current_courses:
-		course_id = _parse_course_id(course.get("id"))
-		course_name = course.get("name")
-		if course_id is not None and isinstance(course_name, str) and course_name:
-			course_names_by_id[course_id] = course_name
-
-	# Debug: save detailed Canvas assignments data
-	debug_data = {}
-	for course_id, assignments in assignments_by_course_id.items():
-		class_name = course_id_to_sheet_tab.get(course_id, course_names_by_id.get(course_id, f"Course {course_id}"))
-		debug_data[class_name] = [
+			records, skipped_no_due_date, skipped_past_date = _assignment_records(
+				all_assignments,
+				matched_tab,
+				include_past_assignments,
+				today_local,
+			)
+			class_records = pending_records.setdefault(matched_tab, [])
+			class_records.extend(records)
+
+			# Debug output
+			total_for_class = len(all_assignments) - skipped_no_due_date
+			print(f"  {matched_tab}: syncing {len(class_records)}/{total_for_class} assignments", end="")
+			if skipped_no_due_date:
+				print(f" (skipped {skipped_no_due_date} without due dates)", end="")
+			if skipped_past_date:
+				print(f" (skipped {skipped_past_date} past due)", end="")
+			print()
+
+		while pending_tabs and last_index_by_tab[pending_tabs[0]] <= index:
+			class_name = pending_tabs.pop(0)
+			records = pending_records.pop(class_name, [])
+			if records:
+				records.sort(
+					key=lambda item: datetime.strptime(item["due-date"], "%m/%d/%Y") if item["due-date"] else datetime.max
+				)
+				yield class_name, records
+
+	CANVAS_RESPONSE_CACHE.save()
+	print(f"Finished fetching assignments for {fetched_courses} courses.")
+
+	if fetch_report is not None:
+		fetch_report.update(
 			{
-				"name": a.get("name"),
-				"due_at": a.get("due_at"),
-				"submission_types": a.get("submission_types"),
-				"published": a.get("published"),
-				"unpublishable": a.get("unpublishable"),
-				"id": a.get("id"),
-				"html_url": a.get("html_url"),
-				"description": a.get("description", "")[:100] if a.get("description") else "",
+				"engine": fetch_engine,
+				"query": query if fetch_engine == "rest" else "",
+				"includeAllDates": resolve_overrides,
+				"courses": report_courses,
 			}
-			for a in assignments
-		]
-	
-	os.makedirs(OUTPUT_DIR, exist_ok=True)
-	with open(CANVAS_ASSIGNMENTS_DEBUG_FILE, "w", encoding="utf-8") as f:
-		json.dump(debug_data, f, indent=2, default=str)
-	print(f"Wrote Canvas API response to {CANVAS_ASSIGNMENTS_DEBUG_FILE}")
-
-	output_by_class: dict[str, list[dict]] = {}
-
-	for course_id, assignments in assignments_by_course_id.items():
-		class_name = course_id_to_sheet_tab.get(course_id, course_names_by_id.get(course_id, f"Course {course_id}"))
-		skipped_no_due_date = 0
-		skipped_past_date = 0
-
-		for assignment in assignments:
-			due_at = assignment.get("due_at")
-			if not due_at:
-				skipped_no_due_date += 1
-				continue
+		)
+		if fetch_engine == "calendar":
+			fetch_report["calendar"] = calendar_stats
+		fetch_report["rateLimit"] = CANVAS_RATE_LIMITER.snapshot(since=rate_limit_start)
+		fetch_report["resilience"] = HOST_RESILIENCE.snapshot(since=resilience_start)
 
-			normalized = due_at.replace("Z", "+00:00")
-			due_dt = datetime.fromisoformat(normalized)
-			due_local_date = due_dt.astimezone().date()
-			if not include_past_assignments and due_local_date < today_local:
-				skipped_past_date += 1
-				continue
+	# Debug: save the projected Canvas assignments data
+	if debug_data is not None and DEBUG_ARTIFACTS.submit(
+		CANVAS_ASSIGNMENTS_DEBUG_FILE,
+		lambda: _compact_json(debug_data),
+		level="full",
+	):
+		print(f"Writing Canvas API response to {CANVAS_ASSIGNMENTS_DEBUG_FILE}")
 
-			assignment_name = assignment.get("name") or ""
-			record = {
-				"assignment name": assignment_name,
-				"due-date": due_local_date.strftime("%m/%d/%Y"),
-				"Class": class_name,
-			}
 
-			output_by_class.setdefault(class_name, []).append(record)
-		
-		# Debug output
-		total_for_class = len([a for a in assignments if a.get("due_at")])
-		synced_count = len(output_by_class.get(class_name, []))
-		print(f"  {class_name}: syncing {synced_count}/{total_for_class} assignments", end="")
-		if skipped_no_due_date:
-			print(f" (skipped {skipped_no_due_date} without due dates)", end="")
-		if skipped_past_date:
-			print(f" (skipped {skipped_past_date} past due)", end="")
-		print()
-
-
-	for class_name, records in output_by_class.items():
-		records.sort(
-			key=lambda item: datetime.strptime(item["due-date"], "%m/%d/%Y") if item["due-date"] else datetime.max
+def fetch_assignments_from_canvas_context(
+	context,
+	sheet_patterns: list[dict],
+	include_past_assignments: bool = False,
+	max_in_flight: int = CANVAS_MAX_IN_FLIGHT,
+	force_refresh: bool = False,
+	engine: str = CANVAS_FETCH_ENGINE,
+	resolve_overrides: bool = False,
+	fetch_report: dict | None = None,
+) -> dict[str, list[dict]]:
+	"""Fetch assignments for courses matching the sheet tabs, grouped and sorted per tab."""
+	return dict(
+		iter_assignments_by_class(
+			context,
+			sheet_patterns,
+			include_past_assignments=include_past_assignments,
+			max_in_flight=max_in_flight,
+			force_refresh=force_refresh,
+			engine=engine,
+			resolve_overrides=resolve_overrides,
+			fetch_report=fetch_report,
 		)
+	)
+
+
+def _compact_json(payload) -> str:
+	return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
 
-	return output_by_class
+class DebugArtifactWriter:
+	"""Writes debug files on a background thread, gated by level.
 
+	"off" writes nothing; "summary" writes the sync response and the sheet tab report;
+	"full" also writes the Canvas assignment dump and the per-class output files.
+	Artifacts are rendered and written off the caller's thread.
+	"""
+
+	def __init__(self, level: str = DEBUG_ARTIFACT_LEVEL):
+		self.level = level
+		self._jobs: queue.Queue[tuple[str, object]] = queue.Queue()
+		self._thread: threading.Thread | None = None
+		self._lock = threading.Lock()
+
+	def set_level(self, level: str) -> None:
+		self.level = level if level in DEBUG_ARTIFACT_LEVELS else DEBUG_ARTIFACT_LEVEL
 
-def save_output(data: list[dict], output_path: str) -> None:
-	with open(output_path, "w", encoding="utf-8") as file:
-		json.dump(data, file, indent=2, ensure_ascii=False)
+	def enabled(self, level: str) -> bool:
+		return DEBUG_ARTIFACT_LEVELS.index(self.level) >= DEBUG_ARTIFACT_LEVELS.index(level)
+
+	def submit(self, path: str, render, level: str = "summary") -> bool:
+		"""Queue render() -> str to be written to path. Returns False when the level is off."""
+		if not self.enabled(level):
+			return False
+		with self._lock:
+			if self._thread is None or not self._thread.is_alive():
+				self._thread = threading.Thread(target=self._run, daemon=True)
+				self._thread.start()
+		self._jobs.put((path, render))
+		return True
+
+	def flush(self) -> None:
+		"""Block until every queued artifact has been written."""
+		self._jobs.join()
+
+	def _run(self) -> None:
+		while True:
+			path, render = self._jobs.get()
+			try:
+				directory = os.path.dirname(path)
+				if directory:
+					os.makedirs(directory, exist_ok=True)
+				with open(path, "w", encoding="utf-8") as file:
+					file.write(render())
+			except Exception as error:
+				print(f"Warning: Could not write debug artifact {path}: {error}")
+			finally:
+				self._jobs.task_done()
+
+
+DEBUG_ARTIFACTS = DebugArtifactWriter()
 
 
 def write_outputs_by_class(data_by_class: dict[str, list[dict]], output_dir: str) -> int:
-	os.makedirs(output_dir, exist_ok=True)
+	"""Queue one JSON file per class at the "full" debug level. Returns the number queued."""
 	file_count = 0
 
 	for class_name, records in data_by_class.items():
 		safe_name = _sanitize_filename(class_name)
 		file_path = os.path.join(output_dir, f"{safe_name}.json")
-		save_output(records, file_path)
-		file_count += 1
+		if DEBUG_ARTIFACTS.submit(file_path, lambda records=records: _compact_json(records), level="full"):
+			file_count += 1
 
 	return file_count
 
 
 def _save_sync_response(payload: dict) -> None:
-	os.makedirs(OUTPUT_DIR, exist_ok=True)
-	with open(SHEET_SYNC_RESPONSE_FILE, "w", encoding="utf-8") as file:
-		json.dump(payload, file, indent=2, ensure_ascii=False)
+	DEBUG_ARTIFACTS.submit(SHEET_SYNC_RESPONSE_FILE, lambda: _compact_json(payload))
 
 
 def _quote_sheet_name(sheet_name: str) -> str:
 	return "'" + sheet_name.replace("'", "''") + "'"
 
 
-def _sheet_assignment_rows(service, spreadsheet_id: str, sheet_name: str) -> list[dict]:
-	range_name = f"{_quote_sheet_name(sheet_name)}!A2:D"
-	values = service.spreadsheets().values().get(
+def _sheet_assignment_rows_bulk(
+	service,
+	spreadsheet_id: str,
+	sheet_names: list[str],
+	dry_run: bool = False,
+) -> dict[str, list[dict]]:
+	"""Rows of every listed tab keyed by tab name, from SHEET_MIRROR or one values.batchGet call.
+
+	Tabs missing from the spreadsheet are left out of the result.
+	"""
+	return SHEET_MIRROR.rows(service, spreadsheet_id, sheet_names, allow_unverified=dry_run)
+
+
+def _sheet_values_bulk(service, spreadsheet_id: str, sheet_names: list[str]) -> dict[str, list[list]]:
+	"""Read A2:D of every listed tab in one values.batchGet call, keyed by tab name."""
+	# One unknown range fails the whole batchGet, so only request tabs the sheet has.
+	existing = {
+		str(props.get("title") or "").strip()
+		for props in SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id)
+	}
+	sheet_names = [name for name in dict.fromkeys(sheet_names) if str(name or "").strip() in existing]
+	if not sheet_names:
+		return {}
+
+	parsed = _execute_google(service.spreadsheets().values().batchGet(
 		spreadsheetId=spreadsheet_id,
-		range=range_name,
-	).execute().get("values", [])
+		ranges=[f"{_quote_sheet_name(sheet_name)}!A2:D" for sheet_name in sheet_names],
+	))
+	value_ranges = parsed.get("valueRanges", [])
+	# Every requested tab exists, so a range the response leaves out is an empty tab.
+	return {
+		sheet_name: (value_ranges[index] if index < len(value_ranges) else {}).get("values", [])
+		for index, sheet_name in enumerate(sheet_names)
+	}
+
+
+_A1_RANGE = re.compile(r"^(?:'((?:[^']|'')+)'|([^!]+))!([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$")
+
+
+def _column_index(letters: str) -> int:
+	index = 0
+	for letter in letters:
+		index = index * 26 + ord(letter) - ord("A") + 1
+	return index - 1
 
+
+def _parse_a1_range(range_name: str) -> tuple[str, int, int, int, int | None] | None:
+	"""Split "'Tab'!B5:D7" into (tab, first column, first row, last column, last row).
+
+	Columns are 0-based and rows 1-based; the last row is None for open ranges like A2:A.
+	"""
+	match = _A1_RANGE.match(str(range_name or ""))
+	if not match:
+		return None
+	quoted, bare, start_col, start_row, end_col, end_row = match.groups()
+	tab = quoted.replace("''", "'") if quoted is not None else bare
+	first_row = int(start_row or 1)
+	if end_col is None:
+		return tab, _column_index(start_col), first_row, _column_index(start_col), first_row
+	return tab, _column_index(start_col), first_row, _column_index(end_col), int(end_row) if end_row else None
+
+
+class SheetMirror:
+	"""Local copy of each spreadsheet's class-tab rows (A2:D), kept current from the app's own writes.
+
+	A tab is read with values.batchGet the first time it is needed and then patched from
+	the ranges SheetWritePlanner clears and the values that values.batchUpdate returns
+	(includeValuesInResponse), so syncs diff against the mirror instead of re-reading.
+	Mirrored rows are only used when SPREADSHEET_CHANGES confirms nobody edited the sheet.
+	When Drive cannot tell, writes re-read every tab, because row numbers taken from a
+	stale copy would overwrite the user's rows; dry runs, which write nothing, accept
+	mirrored tabs younger than SHEET_MIRROR_MAX_AGE_SECONDS.
+	"""
+
+	def __init__(self):
+		self._tabs: dict[tuple[str, str], dict] = {}
+		self._lock = threading.Lock()
+
+	def rows(
+		self,
+		service,
+		spreadsheet_id: str,
+		sheet_names: list[str],
+		allow_unverified: bool = False,
+	) -> dict[str, list[dict]]:
+		sheet_names = list(dict.fromkeys(sheet_names))
+		if not sheet_names:
+			return {}
+		verified = SPREADSHEET_CHANGES.validate(spreadsheet_id) is True
+		now = time.monotonic()
+		with self._lock:
+			stale = [
+				name
+				for name in sheet_names
+				if (spreadsheet_id, name) not in self._tabs
+				or not (
+					verified
+					or (allow_unverified and now - self._tabs[(spreadsheet_id, name)]["readAt"] <= SHEET_MIRROR_MAX_AGE_SECONDS)
+				)
+			]
+
+		values_by_tab = _sheet_values_bulk(service, spreadsheet_id, stale)
+		with self._lock:
+			for name, values in values_by_tab.items():
+				self._tabs[(spreadsheet_id, name)] = {"values": [list(row) for row in values], "readAt": now}
+			return {
+				name: _parse_assignment_rows(self._tabs[(spreadsheet_id, name)]["values"])
+				for name in sheet_names
+				if (spreadsheet_id, name) in self._tabs
+			}
+
+	def apply_clears(self, spreadsheet_id: str, ranges: list[str]) -> None:
+		with self._lock:
+			for range_name in ranges:
+				self._patch(spreadsheet_id, range_name, [])
+
+	def apply_updates(self, spreadsheet_id: str, data: list[dict], responses: list[dict]) -> None:
+		"""Patch the mirror from a values.batchUpdate sent with includeValuesInResponse."""
+		with self._lock:
+			for index, entry in enumerate(data):
+				response = responses[index] if index < len(responses) else {}
+				updated = (response or {}).get("updatedData") or {}
+				if "range" in updated:
+					self._patch(spreadsheet_id, updated["range"], updated.get("values", []))
+					continue
+				# Without the written values the tab can no longer be trusted.
+				parsed = _parse_a1_range(entry.get("range"))
+				if parsed is not None:
+					self._tabs.pop((spreadsheet_id, parsed[0]), None)
+
+	def invalidate(self, spreadsheet_id: str | None = None) -> None:
+		with self._lock:
+			if spreadsheet_id is None:
+				self._tabs.clear()
+			else:
+				for key in [key for key in self._tabs if key[0] == spreadsheet_id]:
+					del self._tabs[key]
+
+	def _patch(self, spreadsheet_id: str, range_name: str, values: list[list]) -> None:
+		parsed = _parse_a1_range(range_name)
+		if parsed is None:
+			return
+		tab, first_col, first_row, last_col, last_row = parsed
+		entry = self._tabs.get((spreadsheet_id, tab))
+		if entry is None:
+			return
+		grid = entry["values"]
+		if last_row is None:
+			last_row = max(first_row + len(values) - 1, len(grid) + 1)
+
+		# The mirror starts at row 2; cells the API left out of the values were written blank.
+		for row_number in range(max(first_row, 2), last_row + 1):
+			row_values = values[row_number - first_row] if row_number - first_row < len(values) else []
+			while len(grid) < row_number - 1:
+				grid.append([])
+			row = grid[row_number - 2]
+			for col in range(first_col, last_col + 1):
+				value = row_values[col - first_col] if col - first_col < len(row_values) else ""
+				while len(row) <= col:
+					row.append("")
+				row[col] = value
+		while grid and not any(str(cell).strip() for cell in grid[-1]):
+			grid.pop()
+
+
+SHEET_MIRROR = SheetMirror()
+
+
+def _parse_assignment_rows(values: list[list]) -> list[dict]:
 	rows: list[dict] = []
 	for idx, row in enumerate(values, start=2):
 		assignment_name = str(row[0]).strip() if len(row) > 0 else ""
@@ -1142,19 +2891,13 @@ def _sheet_assignment_rows(service, spreadsheet_id: str, sheet_name: str) -> lis
 	return rows
 
 
-def _apply_due_date_column_format(service, spreadsheet_id: str, sheet_names: list[str]) -> None:
-	"""Ensure due-date column (B) is formatted as date for the provided tabs."""
+def _due_date_format_requests(service, spreadsheet_id: str, sheet_names: list[str]) -> list[dict]:
+	"""Build repeatCell requests that format column B as a date on the provided tabs."""
 	if not sheet_names:
-		return
-
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="sheets.properties.title,sheets.properties.sheetId",
-	).execute()
+		return []
 
 	sheet_id_by_name: dict[str, int] = {}
-	for sheet in parsed.get("sheets", []):
-		props = sheet.get("properties", {})
+	for props in SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id):
 		title = str(props.get("title") or "").strip()
 		sheet_id = props.get("sheetId")
 		if title and isinstance(sheet_id, int):
@@ -1189,57 +2932,153 @@ def _apply_due_date_column_format(service, spreadsheet_id: str, sheet_names: lis
 			}
 		)
 
-	if not requests:
-		return
+	return requests
 
-	service.spreadsheets().batchUpdate(
-		spreadsheetId=spreadsheet_id,
-		body={"requests": requests},
-	).execute()
+
+class SheetWritePlanner:
+	"""Collects clears, value writes and format requests for a spreadsheet and sends them together.
+
+	flush() issues one values.batchClear, one spreadsheets.batchUpdate and one
+	values.batchUpdate, splitting a call only when its body would exceed
+	SHEETS_MAX_BATCH_BYTES. Clears are sent before the writes that refill those ranges,
+	and SHEET_MIRROR is patched from each call as it completes. Call finish() after the
+	operation's last write.
+	"""
+
+	def __init__(self, service, spreadsheet_id: str):
+		self.service = service
+		self.spreadsheet_id = spreadsheet_id
+		self._clear_ranges: list[str] = []
+		self._requests: list[dict] = []
+		self._data: list[dict] = []
+		self.stats = {"flushes": 0, "apiCalls": 0, "clearedRanges": 0, "formatRequests": 0, "valueRanges": 0}
+
+	def clear(self, ranges: list[str]) -> None:
+		self._clear_ranges.extend(ranges)
+
+	def add_requests(self, requests: list[dict]) -> None:
+		self._requests.extend(requests)
+
+	def update(self, data: list[dict]) -> None:
+		self._data.extend(data)
+
+	def has_pending(self) -> bool:
+		return bool(self._clear_ranges or self._requests or self._data)
+
+	def discard(self) -> None:
+		self._clear_ranges, self._requests, self._data = [], [], []
+
+	def flush(self) -> None:
+		if not self.has_pending():
+			return
+		clear_ranges, self._clear_ranges = self._clear_ranges, []
+		requests, self._requests = self._requests, []
+		data, self._data = self._data, []
+		self.stats["flushes"] += 1
+		try:
+			self._send(clear_ranges, requests, data)
+		except Exception:
+			# A partial flush leaves the mirror unsure of what reached the sheet.
+			SHEET_MIRROR.invalidate(self.spreadsheet_id)
+			SPREADSHEET_CHANGES.forget(self.spreadsheet_id)
+			raise
+
+	def finish(self) -> None:
+		"""Flush what is left, then record the sheet version the app's writes produced.
+
+		The Drive probe runs once per operation rather than per flush.
+		"""
+		self.flush()
+		if self.stats["apiCalls"]:
+			SPREADSHEET_CHANGES.record_own_write(self.spreadsheet_id)
+
+	def _send(self, clear_ranges: list[str], requests: list[dict], data: list[dict]) -> None:
+		for chunk in self._chunks(clear_ranges):
+			_execute_google(self.service.spreadsheets().values().batchClear(
+				spreadsheetId=self.spreadsheet_id,
+				body={"ranges": chunk},
+			), idempotent=True)
+			SHEET_MIRROR.apply_clears(self.spreadsheet_id, chunk)
+			self.stats["apiCalls"] += 1
+			self.stats["clearedRanges"] += len(chunk)
+
+		for chunk in self._chunks(requests):
+			_execute_google(self.service.spreadsheets().batchUpdate(
+				spreadsheetId=self.spreadsheet_id,
+				body={"requests": chunk},
+			), idempotent=True)
+			self.stats["apiCalls"] += 1
+			self.stats["formatRequests"] += len(chunk)
+
+		for chunk in self._chunks(data):
+			response = _execute_google(self.service.spreadsheets().values().batchUpdate(
+				spreadsheetId=self.spreadsheet_id,
+				body={
+					"valueInputOption": "USER_ENTERED",
+					"data": chunk,
+					"includeValuesInResponse": True,
+					"responseValueRenderOption": "FORMATTED_VALUE",
+				},
+			), idempotent=True)
+			SHEET_MIRROR.apply_updates(self.spreadsheet_id, chunk, response.get("responses", []))
+			self.stats["apiCalls"] += 1
+			self.stats["valueRanges"] += len(chunk)
+
+	@staticmethod
+	def _chunks(items: list) -> list[list]:
+		chunks: list[list] = []
+		current: list = []
+		current_bytes = 0
+		for item in items:
+			item_bytes = len(json.dumps(item, ensure_ascii=False).encode("utf-8")) + 1
+			if current and current_bytes + item_bytes > SHEETS_MAX_BATCH_BYTES:
+				chunks.append(current)
+				current = []
+				current_bytes = 0
+			current.append(item)
+			current_bytes += item_bytes
+		if current:
+			chunks.append(current)
+		return chunks
 
 
 def _find_dashboard_sheet_title(service, spreadsheet_id: str) -> str | None:
 	"""Find dashboard tab title using a case-insensitive match."""
-	parsed = service.spreadsheets().get(
-		spreadsheetId=spreadsheet_id,
-		fields="sheets.properties.title",
-	).execute()
-
-	for sheet in parsed.get("sheets", []):
-		title = str(sheet.get("properties", {}).get("title") or "").strip()
+	for props in SPREADSHEET_METADATA.sheet_properties(service, spreadsheet_id):
+		title = str(props.get("title") or "").strip()
 		if "dashboard" in title.casefold():
 			return title
 
 	return None
 
 
-def clear_all_class_tabs() -> dict:
-	service = _google_sheets_service()
-	spreadsheet_id = _require_spreadsheet_id()
-	tabs = fetch_allowed_sheet_classes()
-
+def _clear_class_tabs(service, spreadsheet_id: str, tab_names: list[str]) -> list[dict]:
+	"""Clear columns A, B and D below the header on each tab with one batchGet and one batchClear."""
+	rows_by_tab = _sheet_assignment_rows_bulk(service, spreadsheet_id, tab_names)
+	planner = SheetWritePlanner(service, spreadsheet_id)
 	cleared_tabs: list[dict] = []
-	total_cleared_rows = 0
-	for tab_name in tabs:
-		rows = _sheet_assignment_rows(service, spreadsheet_id, tab_name)
+	for tab_name in tab_names:
+		rows = rows_by_tab.get(tab_name, [])
 		class_cleared_rows = sum(
 			1 for row in rows if row["assignmentName"] or row["dueDate"] or row["className"]
 		)
 		if class_cleared_rows > 0:
-			for col in ("A", "B", "D"):
-				service.spreadsheets().values().clear(
-					spreadsheetId=spreadsheet_id,
-					range=f"{_quote_sheet_name(tab_name)}!{col}2:{col}",
-					body={},
-				).execute()
-
-		total_cleared_rows += class_cleared_rows
+			planner.clear([f"{_quote_sheet_name(tab_name)}!{col}2:{col}" for col in ("A", "B", "D")])
 		cleared_tabs.append({"sheetName": tab_name, "clearedRows": class_cleared_rows})
+	planner.finish()
+	return cleared_tabs
+
 
+def clear_all_class_tabs() -> dict:
+	service = _google_sheets_service()
+	spreadsheet_id = _require_spreadsheet_id()
+	tabs = fetch_allowed_sheet_classes()
+
+	cleared_tabs = _clear_class_tabs(service, spreadsheet_id, tabs)
 	return {
 		"status": "success",
 		"action": "clear_all_class_tabs",
-		"clearedRows": total_cleared_rows,
+		"clearedRows": sum(tab["clearedRows"] for tab in cleared_tabs),
 		"clearedTabs": cleared_tabs,
 	}
 
@@ -1251,22 +3090,13 @@ def clear_single_class_tab(class_name: str) -> dict:
 
 	service = _google_sheets_service()
 	spreadsheet_id = _require_spreadsheet_id()
-	rows = _sheet_assignment_rows(service, spreadsheet_id, name)
-	class_cleared_rows = sum(1 for row in rows if row["assignmentName"] or row["dueDate"] or row["className"])
-
-	if class_cleared_rows > 0:
-		for col in ("A", "B", "D"):
-			service.spreadsheets().values().clear(
-				spreadsheetId=spreadsheet_id,
-				range=f"{_quote_sheet_name(name)}!{col}2:{col}",
-				body={},
-			).execute()
+	cleared_tabs = _clear_class_tabs(service, spreadsheet_id, [name])
 
 	return {
 		"status": "success",
 		"action": "clear_class_tab",
 		"className": name,
-		"clearedRows": class_cleared_rows,
+		"clearedRows": cleared_tabs[0]["clearedRows"],
 	}
 
 
@@ -1424,155 +3254,98 @@ def cache_written_assignment_row(
 	)
 
 
-def sync_assignments_to_sheet(
-	data_by_class: dict[str, list[dict]],
-	dry_run: bool = False,
-	replace_existing: bool = False,
-) -> dict:
-	service = _google_sheets_service()
-	spreadsheet_id = _require_spreadsheet_id()
+def _sheet_sync_items(class_name: str, records: list[dict]) -> list[dict]:
+	return [
+		{
+			"assignmentName": str(record.get("assignment name") or "").strip(),
+			"dueDate": str(record.get("due-date") or "").strip(),
+			"className": class_name,
+		}
+		for record in records
+	]
 
-	flat_records: list[dict] = []
-	grouped: dict[str, list[dict]] = {}
-	for class_name, records in data_by_class.items():
-		for record in records:
-			item = {
-				"assignmentName": str(record.get("assignment name") or "").strip(),
-				"dueDate": str(record.get("due-date") or "").strip(),
-				"className": class_name,
-			}
-			flat_records.append(item)
-			grouped.setdefault(class_name, []).append(item)
 
+def _prepare_sheet_sync(
+	planner: SheetWritePlanner,
+	dry_run: bool,
+	replace_existing: bool,
+	row_count: int | None = None,
+) -> None:
 	mode = "DRY RUN" if dry_run else "LIVE"
 	print(f"Sync mode: {mode}")
 	print(f"Replace existing rows: {'yes' if replace_existing else 'no'}")
-	print(f"Syncing {len(flat_records)} assignment rows to Google Sheet...")
+	if row_count is not None:
+		print(f"Syncing {row_count} assignment rows to Google Sheet...")
 	print(f"Using sheet: {CURRENT_SHEET_URL}")
 
 	if not dry_run:
-		dashboard_title = _find_dashboard_sheet_title(service, spreadsheet_id)
+		dashboard_title = _find_dashboard_sheet_title(planner.service, planner.spreadsheet_id)
 		if dashboard_title:
-			_apply_due_date_column_format(service, spreadsheet_id, [dashboard_title])
+			planner.add_requests(_due_date_format_requests(planner.service, planner.spreadsheet_id, [dashboard_title]))
 		else:
 			print("Warning: Dashboard tab not found; skipped dashboard date format apply.")
 
-	class_stats: dict[str, dict] = {}
-	debug_messages: list[str] = []
-	added_rows = 0
-	updated_rows = 0
-	updated_classes: list[str] = []
-
-	for class_name, class_records in grouped.items():
-		class_records = [item for item in class_records if item["assignmentName"]]
-		class_records.sort(key=lambda x: parse_date_value(x["dueDate"]) or datetime.max)
-		class_updates: list[dict] = []
-
-		all_existing_rows = _sheet_assignment_rows(service, spreadsheet_id, class_name)
-		existing_rows = [row for row in all_existing_rows if row["assignmentName"]]
-
-		class_added = 0
-		class_updated = 0
-		class_matched = 0
 
-		if replace_existing:
-			if not dry_run:
-				service.spreadsheets().values().batchClear(
-					spreadsheetId=spreadsheet_id,
-					body={
-						"ranges": [
-							f"{_quote_sheet_name(class_name)}!A2:A",
-							f"{_quote_sheet_name(class_name)}!B2:B",
-							f"{_quote_sheet_name(class_name)}!D2:D",
-						]
-					},
-				).execute()
-				all_existing_rows = []
-
-			for item in class_records:
-				incoming_due_date = format_due_date(item["dueDate"])
-				if not dry_run:
-					new_row = first_empty_assignment_row(all_existing_rows)
-					class_updates.append(
-						{
-							"range": f"{_quote_sheet_name(class_name)}!A{new_row}:D{new_row}",
-							"values": [[item["assignmentName"], incoming_due_date, "", class_name]],
-						}
-					)
-					cache_written_assignment_row(
-						all_existing_rows,
-						new_row,
-						item["assignmentName"],
-						incoming_due_date,
-						class_name,
-					)
-				added_rows += 1
-				class_added += 1
+def _sync_class_records(
+	service,
+	spreadsheet_id: str,
+	class_name: str,
+	class_records: list[dict],
+	dry_run: bool,
+	replace_existing: bool,
+	debug_messages: list[str],
+	planner: SheetWritePlanner,
+	all_existing_rows: list[dict] | None = None,
+) -> dict:
+	"""Match one class tab's records and queue its writes on planner. Returns its classStats entry.
 
-			if not dry_run and class_updates:
-				service.spreadsheets().values().batchUpdate(
-					spreadsheetId=spreadsheet_id,
-					body={
-						"valueInputOption": "USER_ENTERED",
-						"data": class_updates,
-					},
-				).execute()
-
-			class_stats[class_name] = {
-				"incomingCount": len(class_records),
-				"existingNamedCount": 0,
-				"matchedCount": 0,
-				"addedCount": class_added,
-				"updatedCount": 0,
-				"replaceMode": True,
-			}
-			updated_classes.append(class_name)
-			continue
+	all_existing_rows can carry the tab's rows from a bulk read; otherwise the tab is read here.
+	"""
+	class_records = [item for item in class_records if item["assignmentName"]]
+	class_records.sort(key=lambda x: parse_date_value(x["dueDate"]) or datetime.max)
+	class_updates: list[dict] = []
+
+	if all_existing_rows is None:
+		all_existing_rows = _sheet_assignment_rows_bulk(service, spreadsheet_id, [class_name], dry_run).get(class_name)
+	if all_existing_rows is None:
+		print(f"Warning: Sheet tab not found; skipped class: {class_name}")
+		debug_messages.append(f"tab {class_name} not found in sheet; skipped")
+		return {
+			"incomingCount": len(class_records),
+			"existingNamedCount": 0,
+			"matchedCount": 0,
+			"addedCount": 0,
+			"updatedCount": 0,
+			"replaceMode": replace_existing,
+			"skipped": True,
+		}
+	existing_rows = [row for row in all_existing_rows if row["assignmentName"]]
+
+	class_added = 0
+	class_updated = 0
+	class_matched = 0
+
+	if replace_existing:
+		if not dry_run:
+			planner.clear(
+				[
+					f"{_quote_sheet_name(class_name)}!A2:A",
+					f"{_quote_sheet_name(class_name)}!B2:B",
+					f"{_quote_sheet_name(class_name)}!D2:D",
+				]
+			)
+			all_existing_rows = []
 
 		for item in class_records:
-			best_match = find_best_matching_row(existing_rows, item["assignmentName"])
 			incoming_due_date = format_due_date(item["dueDate"])
-			incoming_due_key = normalize_due_date_key(item["dueDate"])
-
-			if best_match:
-				best_match["matched"] = True
-				class_matched += 1
-				if best_match["dueDateKey"] != incoming_due_key:
-					if not dry_run:
-						class_updates.append(
-							{
-								"range": f"{_quote_sheet_name(class_name)}!B{best_match['rowNumber']}",
-								"values": [[incoming_due_date]],
-							}
-						)
-					debug_messages.append(
-						f"assignment {item['assignmentName']} date updated from "
-						f"{best_match['dueDate'] or '(blank)'} to {incoming_due_date or '(blank)'}"
-					)
-					best_match["dueDate"] = incoming_due_date
-					best_match["dueDateKey"] = incoming_due_key
-					updated_rows += 1
-					class_updated += 1
-
-				if best_match["className"] != class_name and not dry_run:
-					class_updates.append(
-						{
-							"range": f"{_quote_sheet_name(class_name)}!D{best_match['rowNumber']}",
-							"values": [[class_name]],
-						}
-					)
-					best_match["className"] = class_name
-			else:
+			if not dry_run:
 				new_row = first_empty_assignment_row(all_existing_rows)
-				if not dry_run:
-					class_updates.append(
-						{
-							"range": f"{_quote_sheet_name(class_name)}!A{new_row}:D{new_row}",
-							"values": [[item["assignmentName"], incoming_due_date, "", class_name]],
-						}
-					)
-				added_rows += 1
-				class_added += 1
+				class_updates.append(
+					{
+						"range": f"{_quote_sheet_name(class_name)}!A{new_row}:D{new_row}",
+						"values": [[item["assignmentName"], incoming_due_date, "", class_name]],
+					}
+				)
 				cache_written_assignment_row(
 					all_existing_rows,
 					new_row,
@@ -1580,42 +3353,281 @@ def sync_assignments_to_sheet(
 					incoming_due_date,
 					class_name,
 				)
+			class_added += 1
 
 		if not dry_run and class_updates:
-			service.spreadsheets().values().batchUpdate(
-				spreadsheetId=spreadsheet_id,
-				body={
-					"valueInputOption": "USER_ENTERED",
-					"data": class_updates,
-				},
-			).execute()
+			planner.update(class_updates)
 
-		class_stats[class_name] = {
+		return {
 			"incomingCount": len(class_records),
-			"existingNamedCount": len(existing_rows),
-			"matchedCount": class_matched,
+			"existingNamedCount": 0,
+			"matchedCount": 0,
 			"addedCount": class_added,
-			"updatedCount": class_updated,
-			"replaceMode": False,
+			"updatedCount": 0,
+			"replaceMode": True,
 		}
-		updated_classes.append(class_name)
 
+	for item in class_records:
+		best_match = find_best_matching_row(existing_rows, item["assignmentName"])
+		incoming_due_date = format_due_date(item["dueDate"])
+		incoming_due_key = normalize_due_date_key(item["dueDate"])
+
+		if best_match:
+			best_match["matched"] = True
+			class_matched += 1
+			if best_match["dueDateKey"] != incoming_due_key:
+				if not dry_run:
+					class_updates.append(
+						{
+							"range": f"{_quote_sheet_name(class_name)}!B{best_match['rowNumber']}",
+							"values": [[incoming_due_date]],
+						}
+					)
+				debug_messages.append(
+					f"assignment {item['assignmentName']} date updated from "
+					f"{best_match['dueDate'] or '(blank)'} to {incoming_due_date or '(blank)'}"
+				)
+				best_match["dueDate"] = incoming_due_date
+				best_match["dueDateKey"] = incoming_due_key
+				class_updated += 1
+
+			if best_match["className"] != class_name and not dry_run:
+				class_updates.append(
+					{
+						"range": f"{_quote_sheet_name(class_name)}!D{best_match['rowNumber']}",
+						"values": [[class_name]],
+					}
+				)
+				best_match["className"] = class_name
+		else:
+			new_row = first_empty_assignment_row(all_existing_rows)
+			if not dry_run:
+				class_updates.append(
+					{
+						"range": f"{_quote_sheet_name(class_name)}!A{new_row}:D{new_row}",
+						"values": [[item["assignmentName"], incoming_due_date, "", class_name]],
+					}
+				)
+			class_added += 1
+			cache_written_assignment_row(
+				all_existing_rows,
+				new_row,
+				item["assignmentName"],
+				incoming_due_date,
+				class_name,
+			)
+
+	if not dry_run and class_updates:
+		planner.update(class_updates)
+
+	return {
+		"incomingCount": len(class_records),
+		"existingNamedCount": len(existing_rows),
+		"matchedCount": class_matched,
+		"addedCount": class_added,
+		"updatedCount": class_updated,
+		"replaceMode": False,
+	}
+
+
+def _sync_response(
+	dry_run: bool,
+	replace_existing: bool,
+	class_stats: dict[str, dict],
+	debug_messages: list[str],
+	requested_classes: list[str],
+	fetch_report: dict | None,
+	write_stats: dict | None = None,
+	resilience_start: dict | None = None,
+) -> dict:
+	added_rows = sum(stats["addedCount"] for stats in class_stats.values())
+	updated_rows = sum(stats["updatedCount"] for stats in class_stats.values())
 	response = {
 		"status": "success",
 		"dryRun": dry_run,
 		"replaceExisting": replace_existing,
-		"updatedClasses": updated_classes,
+		"updatedClasses": list(class_stats.keys()),
 		"rowsWritten": added_rows + updated_rows,
 		"addedRows": added_rows,
 		"updatedRows": updated_rows,
 		"classStats": class_stats,
 		"debugMessages": debug_messages,
-		"requestedClasses": list(grouped.keys()),
+		"requestedClasses": requested_classes,
 	}
+	if fetch_report is not None:
+		response["canvasFetch"] = fetch_report
+	if write_stats is not None:
+		response["sheetWrites"] = write_stats
+	response["resilience"] = HOST_RESILIENCE.snapshot(since=resilience_start)
 	_save_sync_response(response)
 	return response
 
 
+def sync_assignments_to_sheet(
+	data_by_class: dict[str, list[dict]],
+	dry_run: bool = False,
+	replace_existing: bool = False,
+	fetch_report: dict | None = None,
+) -> dict:
+	service = _google_sheets_service()
+	spreadsheet_id = _require_spreadsheet_id()
+	resilience_start = HOST_RESILIENCE.snapshot()
+
+	grouped = {class_name: _sheet_sync_items(class_name, records) for class_name, records in data_by_class.items()}
+	planner = SheetWritePlanner(service, spreadsheet_id)
+	_prepare_sheet_sync(
+		planner,
+		dry_run,
+		replace_existing,
+		row_count=sum(len(items) for items in grouped.values()),
+	)
+
+	rows_by_tab = _sheet_assignment_rows_bulk(service, spreadsheet_id, list(grouped.keys()), dry_run)
+	class_stats: dict[str, dict] = {}
+	debug_messages: list[str] = []
+	for class_name, class_records in grouped.items():
+		class_stats[class_name] = _sync_class_records(
+			service,
+			spreadsheet_id,
+			class_name,
+			class_records,
+			dry_run,
+			replace_existing,
+			debug_messages,
+			planner,
+			rows_by_tab.get(class_name),
+		)
+	planner.finish()
+
+	return _sync_response(
+		dry_run,
+		replace_existing,
+		class_stats,
+		debug_messages,
+		list(grouped.keys()),
+		fetch_report,
+		planner.stats,
+		resilience_start,
+	)
+
+
+def sync_assignments_pipelined(
+	class_stream,
+	dry_run: bool = False,
+	replace_existing: bool = False,
+	fetch_report: dict | None = None,
+	sheet_names: list[str] | None = None,
+) -> tuple[dict[str, list[dict]], dict]:
+	"""Write each class tab while later courses are still being fetched.
+
+	class_stream yields (class name, records) pairs, e.g. iter_assignments_by_class. It is
+	consumed on the calling thread, and a writer thread syncs each tab as it arrives through
+	the shared Sheets service on its own authorized httplib2 transport. When sheet_names
+	lists the tabs the stream can yield, the writer reads them all in one batchGet while the
+	first courses are fetched.
+
+	Tabs are written in batches of SHEETS_PIPELINE_FLUSH_CLASSES, or sooner once a batch has
+	waited SHEETS_PIPELINE_FLUSH_SECONDS, so earlier tabs fill in while later courses are
+	still being fetched. Replace-existing runs hold every write until the stream ends, and
+	if the stream raises, writes not yet sent are discarded. Returns (data_by_class, sync
+	response) with the same response shape as sync_assignments_to_sheet.
+	"""
+	spreadsheet_id = _require_spreadsheet_id()
+	resilience_start = HOST_RESILIENCE.snapshot()
+	abort = object()
+	pending: queue.Queue = queue.Queue()
+	class_stats: dict[str, dict] = {}
+	debug_messages: list[str] = []
+	writer_errors: list[BaseException] = []
+	write_stats: dict = {}
+
+	def _writer() -> None:
+		try:
+			# The service is shared; this thread sends through its own httplib2 transport.
+			service = _google_sheets_service()
+			planner = SheetWritePlanner(service, spreadsheet_id)
+			write_stats.update(planner.stats)
+			_prepare_sheet_sync(planner, dry_run, replace_existing)
+			rows_by_tab = _sheet_assignment_rows_bulk(service, spreadsheet_id, sheet_names or [], dry_run)
+			held_classes = 0
+			held_since: float | None = None
+			while True:
+				timeout = None
+				if held_since is not None and not replace_existing:
+					timeout = max(0.0, held_since + SHEETS_PIPELINE_FLUSH_SECONDS - time.monotonic())
+				try:
+					entry = pending.get(timeout=timeout)
+				except queue.Empty:
+					entry = ()
+				if entry is abort:
+					planner.discard()
+					return
+				if entry is None:
+					planner.finish()
+					write_stats.update(planner.stats)
+					return
+				if entry:
+					class_name, class_records = entry
+					class_stats[class_name] = _sync_class_records(
+						service,
+						spreadsheet_id,
+						class_name,
+						class_records,
+						dry_run,
+						replace_existing,
+						debug_messages,
+						planner,
+						rows_by_tab.pop(class_name, None),
+					)
+					held_classes += 1
+					if held_since is None:
+						held_since = time.monotonic()
+
+				# Replacements are held to the end so a failed fetch never leaves tabs half-replaced.
+				if replace_existing or held_since is None:
+					continue
+				if held_classes >= SHEETS_PIPELINE_FLUSH_CLASSES or time.monotonic() - held_since >= SHEETS_PIPELINE_FLUSH_SECONDS:
+					planner.flush()
+					write_stats.update(planner.stats)
+					held_classes = 0
+					held_since = None
+		except BaseException as error:
+			writer_errors.append(error)
+
+	writer = threading.Thread(target=_writer, daemon=True)
+	writer.start()
+
+	data_by_class: dict[str, list[dict]] = {}
+	try:
+		for class_name, records in class_stream:
+			data_by_class[class_name] = records
+			if writer_errors:
+				break
+			pending.put((class_name, _sheet_sync_items(class_name, records)))
+	except BaseException:
+		pending.put(abort)
+		writer.join()
+		raise
+	pending.put(None)
+	writer.join()
+
+	if writer_errors:
+		raise writer_errors[0]
+
+	print(f"Synced {sum(len(records) for records in data_by_class.values())} assignment rows to Google Sheet.")
+	response = _sync_response(
+		dry_run,
+		replace_existing,
+		class_stats,
+		debug_messages,
+		list(data_by_class.keys()),
+		fetch_report,
+		write_stats,
+		resilience_start,
+	)
+	return data_by_class, response
+
+
 def choose_sync_mode() -> dict:
 	print("\nSelect sync mode:")
 	print("1) Sync all assignments (past + future)")
@@ -1654,21 +3666,26 @@ def main() -> None:
 				dry_run = mode["dry_run"]
 				replace_existing = mode.get("replace_existing", False)
 
+				fetch_report: dict = {}
 				assignments_by_class = fetch_assignments_from_canvas_context(
 					context,
 					sheet_patterns,
 					include_past_assignments=include_past_assignments,
+					fetch_report=fetch_report,
 				)
 				file_count = write_outputs_by_class(assignments_by_class, OUTPUT_DIR)
-				total_assignments = sum(len(records) for records in assignments_by_class.values())
-				print(f"Saved {total_assignments} assignments into {file_count} file(s) in '{OUTPUT_DIR}'.")
+				if file_count:
+					total_assignments = sum(len(records) for records in assignments_by_class.values())
+					print(f"Saving {total_assignments} assignments into {file_count} file(s) in '{OUTPUT_DIR}'.")
 
 				sync_response = sync_assignments_to_sheet(
 					assignments_by_class,
 					dry_run=dry_run,
 					replace_existing=replace_existing,
+					fetch_report=fetch_report,
 				)
-				print(f"Sheet sync response saved to {SHEET_SYNC_RESPONSE_FILE}")
+				if DEBUG_ARTIFACTS.enabled("summary"):
+					print(f"Sheet sync response saved to {SHEET_SYNC_RESPONSE_FILE}")
 				print(f"Sheet sync status: {sync_response.get('status', 'unknown')}")
 				print(f"Rows written: {sync_response.get('rowsWritten', 0)}")
 				for class_name, stats in sync_response.get("classStats", {}).items():
@@ -1683,6 +3700,7 @@ def main() -> None:
 					print(message)
 
 			browser.close()
+		DEBUG_ARTIFACTS.flush()
 	except json.JSONDecodeError:
 		print("Canvas returned invalid JSON.")
 	except Exception as error:
@@ -0,0 +1,142 @@
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PullFromCanvas as backend
+
+BASE = "https://school.instructure.com/api/v1/courses/7/assignments"
+
+
+def _link(**rels):
+	return ", ".join(f'<{url}>; rel="{rel}"' for rel, url in rels.items())
+
+
+class NumberedPageUrlTests(unittest.TestCase):
+	def test_lists_next_through_last(self):
+		header = _link(
+			current=f"{BASE}?page=1&per_page=100",
+			next=f"{BASE}?page=2&per_page=100",
+			last=f"{BASE}?page=4&per_page=100",
+		)
+		self.assertEqual(backend._numbered_page_urls(header), [
+			f"{BASE}?page=2&per_page=100",
+			f"{BASE}?page=3&per_page=100",
+			f"{BASE}?page=4&per_page=100",
+		])
+
+	def test_does_not_confuse_per_page_with_page(self):
+		header = _link(
+			next=f"{BASE}?per_page=50&page=2",
+			last=f"{BASE}?per_page=50&page=3",
+		)
+		self.assertEqual(backend._numbered_page_urls(header), [
+			f"{BASE}?per_page=50&page=2",
+			f"{BASE}?per_page=50&page=3",
+		])
+
+	def test_single_remaining_page(self):
+		header = _link(next=f"{BASE}?page=2", last=f"{BASE}?page=2")
+		self.assertEqual(backend._numbered_page_urls(header), [f"{BASE}?page=2"])
+
+	def test_bookmark_cursor_is_followed_one_page_at_a_time(self):
+		header = _link(next=f"{BASE}?page=bookmark:WzEyXQ&per_page=100", last=f"{BASE}?page=bookmark:Wzk5XQ&per_page=100")
+		self.assertIsNone(backend._numbered_page_urls(header))
+
+	def test_missing_last_link(self):
+		self.assertIsNone(backend._numbered_page_urls(_link(next=f"{BASE}?page=2")))
+		self.assertIsNone(backend._numbered_page_urls(None))
+
+	def test_next_and_last_with_different_queries(self):
+		header = _link(next=f"{BASE}?page=2&per_page=100", last=f"{BASE}?page=5&per_page=10")
+		self.assertIsNone(backend._numbered_page_urls(header))
+
+
+class DecodePageItemsTests(unittest.TestCase):
+	def test_projects_listed_fields(self):
+		body = json.dumps([
+			{"id": 1, "name": "HW 1", "description": "<p>long</p>", "due_at": "2030-01-15T23:59:00Z"},
+			{"id": 2, "name": "HW 2", "description": "<p>longer</p>", "due_at": None},
+		]).encode("utf-8")
+		self.assertEqual(backend._decode_page_items(body, ["id", "name", "due_at"]), [
+			{"id": 1, "name": "HW 1", "due_at": "2030-01-15T23:59:00Z"},
+			{"id": 2, "name": "HW 2", "due_at": None},
+		])
+
+	def test_dotted_field_keeps_one_nested_key(self):
+		body = '[{"title": "Quiz", "assignment": {"id": 9, "due_at": "x", "rubric": []}}, {"title": "Event"}]'
+		self.assertEqual(backend._decode_page_items(body, ["title", "assignment.due_at"]), [
+			{"title": "Quiz", "assignment": {"due_at": "x"}},
+			{"title": "Event"},
+		])
+
+	def test_without_fields_returns_items_unchanged(self):
+		items = [{"id": 1, "nested": {"a": [1, 2]}}, 3, "text"]
+		self.assertEqual(backend._decode_page_items(json.dumps(items, indent=2), None), items)
+
+	def test_empty_array(self):
+		self.assertEqual(backend._decode_page_items(b" [ ] ", ["id"]), [])
+
+	def test_non_array_payload(self):
+		self.assertIsNone(backend._decode_page_items(b'{"errors": []}', ["id"]))
+
+	def test_malformed_array_raises(self):
+		with self.assertRaises(json.JSONDecodeError):
+			backend._decode_page_items(b'[{"id": 1} {"id": 2}]', ["id"])
+
+
+class CanvasResponseCachePruneTests(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.addCleanup(self.directory.cleanup)
+		self.path = os.path.join(self.directory.name, "canvas_cache.json.gz")
+
+	def _saved_urls(self) -> list[str]:
+		with gzip.open(self.path, "rt", encoding="utf-8") as file:
+			return list(json.load(file)["entries"])
+
+	def _cache_with(self, entries: dict[str, dict]) -> backend.CanvasResponseCache:
+		cache = backend.CanvasResponseCache(self.path)
+		cache._loaded = True
+		cache._entries = entries
+		cache._dirty = True
+		return cache
+
+	def test_save_drops_stale_entries(self):
+		now = time.time()
+		day = 86400
+		cache = self._cache_with({
+			"fresh": {"fetched_at": now},
+			"unvalidated-old": {"fetched_at": now - 2 * day},
+			"validated-old": {"etag": '"v1"', "fetched_at": now - 2 * day},
+			"last-modified-old": {"last_modified": "Mon, 01 Jan 2029 00:00:00 GMT", "fetched_at": now - 3 * day},
+			"validated-expired": {"etag": '"v2"', "fetched_at": now - backend.CANVAS_CACHE_MAX_AGE_SECONDS - day},
+			"broken": "not an entry",
+		})
+		cache.save()
+		self.assertEqual(sorted(self._saved_urls()), ["fresh", "last-modified-old", "validated-old"])
+
+	def test_save_keeps_most_recent_entries_up_to_the_cap(self):
+		now = time.time()
+		cache = self._cache_with({f"page-{index}": {"etag": "e", "fetched_at": now - index} for index in range(5)})
+		with mock.patch.object(backend, "CANVAS_CACHE_MAX_ENTRIES", 2):
+			cache.save()
+		self.assertEqual(self._saved_urls(), ["page-0", "page-1"])
+
+	def test_pruned_cache_reloads(self):
+		cache = self._cache_with({})
+		cache.store(f"{BASE}?page=1", '"e"', None, [{"id": 1}], None, ["id"])
+		cache.save()
+
+		reloaded = backend.CanvasResponseCache(self.path)
+		self.assertEqual(reloaded.get(f"{BASE}?page=1")["items"], [{"id": 1}])
+
+
+if __name__ == "__main__":
+	unittest.main()
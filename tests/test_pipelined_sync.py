@@ -0,0 +1,147 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PullFromCanvas as backend
+
+TABS = ["Math", "Physics", "History", "Biology"]
+
+
+class _FakeRequest:
+	def __init__(self, sheets, name, kwargs):
+		self.sheets = sheets
+		self.name = name
+		self.kwargs = kwargs
+		self.uri = "https://sheets.googleapis.com/v4/spreadsheets"
+		self.method = "GET" if name.endswith("get") or name.endswith("batchGet") else "POST"
+
+	def execute(self):
+		return self.sheets.respond(self.name, self.kwargs)
+
+
+class _FakeNode:
+	def __init__(self, sheets, path):
+		self._sheets = sheets
+		self._path = path
+
+	def __getattr__(self, name):
+		path = f"{self._path}.{name}"
+
+		def call(**kwargs):
+			if name in ("spreadsheets", "values"):
+				return _FakeNode(self._sheets, path)
+			return _FakeRequest(self._sheets, path, kwargs)
+
+		return call
+
+
+class FakeSheets(_FakeNode):
+	"""Records each Sheets call together with how many classes the stream had yielded by then."""
+
+	def __init__(self):
+		super().__init__(self, "")
+		self.calls: list[tuple[str, int, bool]] = []
+		self.yielded = 0
+		self.stream_done = False
+		self.value_write = threading.Event()
+
+	def respond(self, name, kwargs):
+		self.calls.append((name, self.yielded, self.stream_done))
+		if name == ".spreadsheets.get":
+			titles = ["Dashboard"] + TABS
+			return {"sheets": [{"properties": {"title": title, "sheetId": index, "index": index}} for index, title in enumerate(titles)]}
+		if name == ".spreadsheets.values.batchGet":
+			return {"valueRanges": [{"range": range_name} for range_name in kwargs["ranges"]]}
+		if name == ".spreadsheets.values.batchUpdate":
+			self.value_write.set()
+			return {"responses": [{"updatedData": data} for data in kwargs["body"]["data"]]}
+		return {}
+
+	def names(self, name):
+		return [call for call in self.calls if call[0] == name]
+
+
+class PipelinedSyncTests(unittest.TestCase):
+	def setUp(self):
+		self.sheets = FakeSheets()
+		patches = [
+			mock.patch.object(backend, "_google_sheets_service", return_value=self.sheets),
+			mock.patch.object(backend, "_require_spreadsheet_id", return_value="sid"),
+			mock.patch.object(backend.SPREADSHEET_CHANGES, "validate", return_value=None),
+			mock.patch.object(backend.SPREADSHEET_CHANGES, "record_own_write"),
+			mock.patch.object(backend, "_save_sync_response"),
+		]
+		for patcher in patches:
+			patcher.start()
+			self.addCleanup(patcher.stop)
+		backend.SPREADSHEET_METADATA.invalidate()
+		backend.SHEET_MIRROR.invalidate()
+		self.addCleanup(backend.SPREADSHEET_METADATA.invalidate)
+		self.addCleanup(backend.SHEET_MIRROR.invalidate)
+
+	def _stream(self, fail_at: int | None = None, wait_for_write_after: int | None = None):
+		for index, tab in enumerate(TABS):
+			if index == fail_at:
+				raise RuntimeError("Canvas fetch failed")
+			self.sheets.yielded = index + 1
+			yield tab, [{"assignment name": f"{tab} HW", "due-date": "01/15/2030"}]
+			if wait_for_write_after == index + 1:
+				# Stand in for a slow Canvas fetch so the writer can catch up.
+				self.sheets.value_write.wait(5)
+		self.sheets.stream_done = True
+
+	def test_writes_go_out_while_the_stream_is_still_running(self):
+		data_by_class, response = backend.sync_assignments_pipelined(
+			self._stream(wait_for_write_after=backend.SHEETS_PIPELINE_FLUSH_CLASSES),
+			sheet_names=TABS,
+		)
+
+		writes = self.sheets.names(".spreadsheets.values.batchUpdate")
+		self.assertGreaterEqual(len(writes), 2)
+		self.assertFalse(writes[0][2], "first batch should be sent before the stream ends")
+		self.assertEqual(writes[0][1], backend.SHEETS_PIPELINE_FLUSH_CLASSES)
+		self.assertEqual(list(data_by_class), TABS)
+		self.assertEqual(response["addedRows"], len(TABS))
+		self.assertEqual(response["sheetWrites"]["valueRanges"], len(TABS))
+
+	def test_time_threshold_flushes_a_partial_batch(self):
+		with mock.patch.object(backend, "SHEETS_PIPELINE_FLUSH_CLASSES", 10), \
+			mock.patch.object(backend, "SHEETS_PIPELINE_FLUSH_SECONDS", 0.05):
+			backend.sync_assignments_pipelined(self._stream(wait_for_write_after=1), sheet_names=TABS)
+
+		writes = self.sheets.names(".spreadsheets.values.batchUpdate")
+		self.assertFalse(writes[0][2])
+		self.assertEqual(writes[0][1], 1)
+
+	def test_replace_existing_holds_writes_until_the_stream_ends(self):
+		stream = self._stream()
+		backend.sync_assignments_pipelined(stream, replace_existing=True, sheet_names=TABS)
+
+		for name in (".spreadsheets.values.batchClear", ".spreadsheets.values.batchUpdate"):
+			calls = self.sheets.names(name)
+			self.assertEqual(len(calls), 1)
+			self.assertTrue(calls[0][2])
+
+	def test_stream_failure_discards_unsent_replacements(self):
+		with self.assertRaises(RuntimeError):
+			backend.sync_assignments_pipelined(self._stream(fail_at=3), replace_existing=True, sheet_names=TABS)
+
+		self.assertEqual(self.sheets.names(".spreadsheets.values.batchClear"), [])
+		self.assertEqual(self.sheets.names(".spreadsheets.values.batchUpdate"), [])
+
+	def test_dry_run_sends_no_writes(self):
+		started = time.monotonic()
+		data_by_class, response = backend.sync_assignments_pipelined(self._stream(), dry_run=True, sheet_names=TABS)
+
+		self.assertLess(time.monotonic() - started, 5)
+		self.assertEqual(self.sheets.names(".spreadsheets.values.batchUpdate"), [])
+		self.assertEqual(response["addedRows"], len(TABS))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,245 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PullFromCanvas as backend
+
+HOST = "school.instructure.com"
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 1000.0
+		self.waits: list[float] = []
+
+	def __call__(self) -> float:
+		return self.now
+
+	def advance(self, seconds: float) -> None:
+		self.waits.append(seconds)
+		self.now += seconds
+
+
+class FakeResponse:
+	def __init__(self, status: int = 200, headers: dict | None = None):
+		self.status = status
+		self.status_text = "Status"
+		self.headers = {key.lower(): value for key, value in (headers or {}).items()}
+
+	def text(self) -> str:
+		return ""
+
+
+class FakeGoogleRequest:
+	def __init__(self, error: Exception | None = None, method: str = "GET"):
+		self.uri = "https://sheets.googleapis.com/v4/spreadsheets/sid"
+		self.method = method
+		self.error = error
+		self.calls = 0
+
+	def execute(self):
+		self.calls += 1
+		if self.error is not None:
+			raise self.error
+		return {"ok": True}
+
+
+class FakeCanvasContext:
+	def __init__(self, *outcomes):
+		self.outcomes = list(outcomes)
+		self.calls = 0
+
+	def get(self, url, **kwargs):
+		self.calls += 1
+		outcome = self.outcomes[min(self.calls, len(self.outcomes)) - 1]
+		if isinstance(outcome, Exception):
+			raise outcome
+		return outcome
+
+
+class HostResilienceTests(unittest.TestCase):
+	def setUp(self):
+		self.clock = FakeClock()
+		self.resilience = backend.HostResilience(clock=self.clock, jitter=lambda low, high: high)
+
+	def _fail(self, times: int) -> None:
+		for _ in range(times):
+			self.resilience.before_call(HOST)
+			self.resilience.record_failure(HOST)
+
+	def test_circuit_opens_at_threshold_and_fails_fast(self):
+		self._fail(backend.CIRCUIT_FAILURE_THRESHOLD - 1)
+		self.assertEqual(self.resilience.snapshot()["openCircuits"], [])
+
+		self._fail(1)
+		self.assertEqual(self.resilience.snapshot()["openCircuits"], [HOST])
+		self.clock.advance(backend.CIRCUIT_COOLDOWN_SECONDS - 1)
+		with self.assertRaises(RuntimeError):
+			self.resilience.before_call(HOST)
+		self.resilience.before_call("other.example.com")
+
+		stats = self.resilience.snapshot()
+		self.assertEqual(stats["circuitOpens"], 1)
+		self.assertEqual(stats["shortCircuited"], 1)
+		self.assertEqual(stats["failures"], backend.CIRCUIT_FAILURE_THRESHOLD)
+
+	def test_half_open_trial_success_closes_the_circuit(self):
+		self._fail(backend.CIRCUIT_FAILURE_THRESHOLD)
+		self.clock.advance(backend.CIRCUIT_COOLDOWN_SECONDS)
+
+		self.resilience.before_call(HOST)
+		self.assertEqual(self.resilience.snapshot()["openCircuits"], [])
+		self.resilience.record_success(HOST)
+
+		# Closed again: it takes a full run of failures to re-open.
+		self._fail(backend.CIRCUIT_FAILURE_THRESHOLD - 1)
+		self.assertEqual(self.resilience.snapshot()["openCircuits"], [])
+
+	def test_half_open_trial_failure_reopens_immediately(self):
+		self._fail(backend.CIRCUIT_FAILURE_THRESHOLD)
+		self.clock.advance(backend.CIRCUIT_COOLDOWN_SECONDS)
+
+		self._fail(1)
+		self.assertEqual(self.resilience.snapshot()["openCircuits"], [HOST])
+		self.assertEqual(self.resilience.snapshot()["circuitOpens"], 2)
+		with self.assertRaises(RuntimeError):
+			self.resilience.before_call(HOST)
+
+	def test_backoff_is_capped_and_counted(self):
+		delays = [self.resilience.backoff(attempt) for attempt in range(8)]
+
+		self.assertEqual(delays[0], backend.RETRY_BASE_DELAY_SECONDS)
+		self.assertEqual(delays[1], backend.RETRY_BASE_DELAY_SECONDS * 2)
+		self.assertEqual(max(delays), backend.RETRY_MAX_DELAY_SECONDS)
+		stats = self.resilience.snapshot()
+		self.assertEqual(stats["retries"], 8)
+		self.assertAlmostEqual(stats["retrySeconds"], round(sum(delays), 3))
+
+	def test_snapshot_since_reports_growth(self):
+		self._fail(2)
+		start = self.resilience.snapshot()
+		self._fail(1)
+		self.assertEqual(self.resilience.snapshot(start)["failures"], 1)
+
+
+class RetryBudgetTests(unittest.TestCase):
+	def setUp(self):
+		self.clock = FakeClock()
+		self.resilience = backend.HostResilience(clock=self.clock, jitter=lambda low, high: high)
+		self.limiter = backend.CanvasRateLimiter(clock=self.clock, wait=self.clock.advance)
+		patches = [
+			mock.patch.object(backend, "HOST_RESILIENCE", self.resilience),
+			mock.patch.object(backend, "CANVAS_RATE_LIMITER", self.limiter),
+			mock.patch.object(backend.time, "sleep", side_effect=self.clock.advance),
+		]
+		for patcher in patches:
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+	def test_google_transient_errors_use_the_whole_budget(self):
+		request = FakeGoogleRequest(ConnectionError("reset"))
+		with self.assertRaises(ConnectionError):
+			backend._execute_google(request)
+
+		self.assertEqual(request.calls, backend.RETRY_MAX_ATTEMPTS)
+		self.assertEqual(self.resilience.snapshot()["retries"], backend.RETRY_MAX_ATTEMPTS - 1)
+		self.assertEqual(len(self.clock.waits), backend.RETRY_MAX_ATTEMPTS - 1)
+
+	def test_google_non_idempotent_call_is_not_retried(self):
+		request = FakeGoogleRequest(ConnectionError("reset"), method="POST")
+		with self.assertRaises(ConnectionError):
+			backend._execute_google(request)
+		self.assertEqual(request.calls, 1)
+
+	def test_google_permanent_error_is_not_retried_or_counted(self):
+		error = RuntimeError("bad request")
+		error.resp = FakeResponse(400)
+		request = FakeGoogleRequest(error)
+		with self.assertRaises(RuntimeError):
+			backend._execute_google(request)
+
+		self.assertEqual(request.calls, 1)
+		self.assertEqual(self.resilience.snapshot()["failures"], 0)
+
+	def test_open_circuit_stops_retries_early(self):
+		with self.assertRaises(ConnectionError):
+			backend._execute_google(FakeGoogleRequest(ConnectionError("reset")))
+
+		request = FakeGoogleRequest(ConnectionError("reset"))
+		with self.assertRaises(RuntimeError):
+			backend._execute_google(request)
+		self.assertEqual(request.calls, backend.CIRCUIT_FAILURE_THRESHOLD - backend.RETRY_MAX_ATTEMPTS)
+
+	def test_canvas_transport_failure_is_wrapped_after_the_budget(self):
+		context = FakeCanvasContext(ConnectionError("reset"))
+		with self.assertRaises(RuntimeError) as raised:
+			backend._canvas_request(context, "get", f"https://{HOST}/api/v1/courses")
+
+		self.assertIsInstance(raised.exception.__cause__, ConnectionError)
+		self.assertEqual(context.calls, backend.RETRY_MAX_ATTEMPTS)
+
+	def test_canvas_server_error_then_success(self):
+		context = FakeCanvasContext(FakeResponse(503), FakeResponse(200))
+		response = backend._canvas_request(context, "get", f"https://{HOST}/api/v1/courses")
+
+		self.assertEqual(response.status, 200)
+		self.assertEqual(self.clock.waits, [backend.RETRY_BASE_DELAY_SECONDS])
+
+	def test_canvas_throttling_backs_off_then_gives_up(self):
+		context = FakeCanvasContext(FakeResponse(429))
+		response = backend._canvas_request(context, "get", f"https://{HOST}/api/v1/courses")
+
+		self.assertEqual(response.status, 429)
+		self.assertEqual(context.calls, backend.CANVAS_RATE_LIMIT_MAX_RETRIES + 1)
+		self.assertEqual(self.limiter.snapshot()["rateLimited"], backend.CANVAS_RATE_LIMIT_MAX_RETRIES)
+		self.assertEqual(self.resilience.snapshot()["failures"], 0)
+
+
+class CanvasRateLimiterTests(unittest.TestCase):
+	def setUp(self):
+		self.clock = FakeClock()
+		self.limiter = backend.CanvasRateLimiter(clock=self.clock, wait=self.clock.advance)
+
+	def test_no_pacing_before_the_first_quota_header(self):
+		self.limiter.acquire()
+		self.assertEqual(self.clock.waits, [])
+
+	def test_waits_for_refill_when_remaining_is_below_the_floor(self):
+		remaining = backend.CANVAS_RATE_LIMIT_FLOOR - 50
+		self.limiter.acquire()
+		self.limiter.release(FakeResponse(headers={"X-Rate-Limit-Remaining": str(remaining)}))
+
+		self.limiter.acquire()
+		self.assertEqual(self.clock.waits, [50 / backend.CANVAS_RATE_LIMIT_REFILL_PER_SECOND])
+		stats = self.limiter.snapshot()
+		self.assertEqual(stats["remaining"], remaining)
+		self.assertEqual(stats["pacedWaits"], 1)
+
+	def test_in_flight_requests_count_against_the_quota(self):
+		self.limiter.acquire()
+		self.limiter.release(FakeResponse(headers={"X-Rate-Limit-Remaining": "200"}))
+
+		self.limiter.acquire()
+		self.assertEqual(self.clock.waits, [])
+		self.limiter.acquire()
+		self.assertEqual(len(self.clock.waits), 1)
+
+	def test_request_cost_updates_the_running_average(self):
+		self.limiter.acquire()
+		self.limiter.release(FakeResponse(headers={"X-Rate-Limit-Remaining": "700", "X-Request-Cost": "11"}))
+		self.assertEqual(self.limiter.snapshot()["averageCost"], 3.0)
+
+	def test_throttled_empties_the_bucket_and_backs_off_exponentially(self):
+		self.assertEqual(self.limiter.throttled(0), backend.CANVAS_RATE_LIMIT_BACKOFF_SECONDS)
+		self.assertEqual(self.limiter.throttled(1), backend.CANVAS_RATE_LIMIT_BACKOFF_SECONDS * 2)
+		self.assertEqual(self.limiter.throttled(20), 30.0)
+
+		self.limiter.acquire()
+		self.assertAlmostEqual(sum(self.clock.waits), backend.CANVAS_RATE_LIMIT_FLOOR / backend.CANVAS_RATE_LIMIT_REFILL_PER_SECOND)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PullFromCanvas as backend
+
+
+class ParseA1RangeTests(unittest.TestCase):
+	def test_single_cell(self):
+		self.assertEqual(backend._parse_a1_range("'Math'!B5"), ("Math", 1, 5, 1, 5))
+
+	def test_bounded_block(self):
+		self.assertEqual(backend._parse_a1_range("'Math'!A7:D7"), ("Math", 0, 7, 3, 7))
+
+	def test_open_column_range(self):
+		self.assertEqual(backend._parse_a1_range("Math!A2:D"), ("Math", 0, 2, 3, None))
+
+	def test_quoted_tab_with_apostrophe_and_bang(self):
+		self.assertEqual(backend._parse_a1_range("'Bob''s! class'!D3"), ("Bob's! class", 3, 3, 3, 3))
+
+	def test_round_trips_quote_sheet_name(self):
+		name = "2025FS-CS-1570-101 [Lab]"
+		range_name = f"{backend._quote_sheet_name(name)}!A12:D12"
+		self.assertEqual(backend._parse_a1_range(range_name), (name, 0, 12, 3, 12))
+
+	def test_multi_letter_columns(self):
+		self.assertEqual(backend._parse_a1_range("T!AA1:AB2"), ("T", 26, 1, 27, 2))
+
+	def test_rejects_unparseable_ranges(self):
+		for range_name in ("", "Math", "'Math'!", "Math!5B", None):
+			self.assertIsNone(backend._parse_a1_range(range_name))
+
+
+class SheetMirrorPatchTests(unittest.TestCase):
+	def setUp(self):
+		self.mirror = backend.SheetMirror()
+		self.grid = [
+			["HW1", "01/05/2030", "TRUE", "Math"],
+			["HW2", "01/06/2030", "", "Math"],
+			["HW3", "01/07/2030", "", "Math"],
+		]
+		self.mirror._tabs[("sid", "Math")] = {"values": self.grid, "readAt": 0.0}
+
+	def test_single_cell_update(self):
+		self.mirror._patch("sid", "'Math'!B3", [["02/01/2030"]])
+		self.assertEqual(self.grid[1], ["HW2", "02/01/2030", "", "Math"])
+		self.assertEqual(self.grid[0][1], "01/05/2030")
+
+	def test_row_write_appends_past_end(self):
+		self.mirror._patch("sid", "'Math'!A6:D6", [["HW9", "03/01/2030", "", "Math"]])
+		self.assertEqual(len(self.grid), 5)
+		self.assertEqual(self.grid[3], [])
+		self.assertEqual(self.grid[4], ["HW9", "03/01/2030", "", "Math"])
+
+	def test_cells_left_out_of_response_are_blank(self):
+		# The API trims trailing empty cells from updatedData values.
+		self.mirror._patch("sid", "'Math'!A2:D2", [["HW1"]])
+		self.assertEqual(self.grid[0], ["HW1", "", "", ""])
+
+	def test_open_range_clear_keeps_other_columns(self):
+		self.mirror._patch("sid", "'Math'!B2:B", [])
+		self.assertEqual([row[1] for row in self.grid], ["", "", ""])
+		self.assertEqual([row[0] for row in self.grid], ["HW1", "HW2", "HW3"])
+
+	def test_clearing_all_columns_trims_trailing_rows(self):
+		for col in ("A", "B", "C", "D"):
+			self.mirror._patch("sid", f"'Math'!{col}2:{col}", [])
+		self.assertEqual(self.grid, [])
+
+	def test_header_row_is_not_mirrored(self):
+		self.mirror._patch("sid", "'Math'!A1:D2", [["Name", "Due", "", "Class"], ["HW0", "", "", "Math"]])
+		self.assertEqual(self.grid[0], ["HW0", "", "", "Math"])
+		self.assertEqual(len(self.grid), 3)
+
+	def test_unknown_tab_and_bad_range_are_ignored(self):
+		before = [list(row) for row in self.grid]
+		self.mirror._patch("sid", "'Other'!A2:D2", [["x", "y", "", "z"]])
+		self.mirror._patch("other-sid", "'Math'!A2:D2", [["x", "y", "", "z"]])
+		self.mirror._patch("sid", "not a range", [["x"]])
+		self.assertEqual(self.grid, before)
+
+	def test_parsed_rows_match_patched_grid(self):
+		self.mirror._patch("sid", "'Math'!A3:D3", [["HW2b", "02/02/2030", "", "Math"]])
+		rows = backend._parse_assignment_rows(self.grid)
+		self.assertEqual(rows[1]["rowNumber"], 3)
+		self.assertEqual(rows[1]["assignmentName"], "HW2b")
+		self.assertEqual(rows[1]["dueDateKey"], backend.normalize_due_date_key("02/02/2030"))
+
+	def test_apply_updates_drops_tab_without_updated_data(self):
+		self.mirror.apply_updates("sid", [{"range": "'Math'!B2", "values": [["x"]]}], [{}])
+		self.assertNotIn(("sid", "Math"), self.mirror._tabs)
+
+
+if __name__ == "__main__":
+	unittest.main()